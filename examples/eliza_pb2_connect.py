@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from collections.abc import AsyncIterator
+from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Iterable
 import aiohttp
@@ -9,6 +10,7 @@ import urllib3
 import typing
 import sys
 
+from google.protobuf.message import Message
 from connectrpc.client_async import AsyncConnectClient
 from connectrpc.client_sync import ConnectClient
 from connectrpc.client_protocol import ConnectProtocol
@@ -34,7 +36,33 @@ if typing.TYPE_CHECKING:
 
 import eliza_pb2
 
+_T = typing.TypeVar("_T", bound=Message)
+
+
+def _unwrap_unary(response: UnaryOutput[_T]) -> _T:
+    err = response.error()
+    if err is not None:
+        raise err
+    msg = response.message()
+    if msg is None:
+        raise ConnectProtocolError('missing response message')
+    return msg
+
+
+def _unwrap_stream(call: Callable[[], StreamOutput[_T]]) -> Iterator[_T]:
+    stream_output = call()
+    err = stream_output.error()
+    if err is not None:
+        raise err
+    yield from stream_output
+    err = stream_output.error()
+    if err is not None:
+        raise err
+
+
 class ElizaServiceClient:
+    __slots__ = ("base_url", "_connect_client", "_url_say", "_url_converse", "_url_introduce")
+
     def __init__(
         self,
         base_url: str,
@@ -43,48 +71,32 @@ class ElizaServiceClient:
     ):
         self.base_url = base_url
         self._connect_client = ConnectClient(http_client, protocol)
+        self._url_say = base_url + "/connectrpc.eliza.v1.ElizaService/Say"
+        self._url_converse = base_url + "/connectrpc.eliza.v1.ElizaService/Converse"
+        self._url_introduce = base_url + "/connectrpc.eliza.v1.ElizaService/Introduce"
     def call_say(
         self, req: eliza_pb2.SayRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[eliza_pb2.SayResponse]:
         """Low-level method to call Say, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Say"
+        url = self._url_say
         return self._connect_client.call_unary(url, req, eliza_pb2.SayResponse,extra_headers, timeout_seconds)
 
 
     def say(
         self, req: eliza_pb2.SayRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> eliza_pb2.SayResponse:
-        response = self.call_say(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(self.call_say(req, extra_headers, timeout_seconds))
 
     def converse(
         self, reqs: Iterable[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> Iterator[eliza_pb2.ConverseResponse]:
-        return self._converse_iterator(reqs, extra_headers, timeout_seconds)
-
-    def _converse_iterator(
-        self, reqs: Iterable[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> Iterator[eliza_pb2.ConverseResponse]:
-        stream_output = self.call_converse(reqs, extra_headers, timeout_seconds)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        yield from stream_output
-        err = stream_output.error()
-        if err is not None:
-            raise err
+        return _unwrap_stream(lambda: self.call_converse(reqs, extra_headers, timeout_seconds))
 
     def call_converse(
         self, reqs: Iterable[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> StreamOutput[eliza_pb2.ConverseResponse]:
         """Low-level method to call Converse, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Converse"
+        url = self._url_converse
         return self._connect_client.call_bidirectional_streaming(
             url, reqs, eliza_pb2.ConverseResponse, extra_headers, timeout_seconds
         )
@@ -92,31 +104,21 @@ class ElizaServiceClient:
     def introduce(
         self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> Iterator[eliza_pb2.IntroduceResponse]:
-        return self._introduce_iterator(req, extra_headers, timeout_seconds)
-
-    def _introduce_iterator(
-        self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> Iterator[eliza_pb2.IntroduceResponse]:
-        stream_output = self.call_introduce(req, extra_headers)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        yield from stream_output
-        err = stream_output.error()
-        if err is not None:
-            raise err
+        return _unwrap_stream(lambda: self.call_introduce(req, extra_headers, timeout_seconds))
 
     def call_introduce(
         self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> StreamOutput[eliza_pb2.IntroduceResponse]:
         """Low-level method to call Introduce, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Introduce"
+        url = self._url_introduce
         return self._connect_client.call_server_streaming(
             url, req, eliza_pb2.IntroduceResponse, extra_headers, timeout_seconds
         )
 
 
 class AsyncElizaServiceClient:
+    __slots__ = ("base_url", "_connect_client", "_url_say", "_url_converse", "_url_introduce")
+
     def __init__(
         self,
         base_url: str,
@@ -125,39 +127,26 @@ class AsyncElizaServiceClient:
     ):
         self.base_url = base_url
         self._connect_client = AsyncConnectClient(http_client, protocol)
+        self._url_say = base_url + "/connectrpc.eliza.v1.ElizaService/Say"
+        self._url_converse = base_url + "/connectrpc.eliza.v1.ElizaService/Converse"
+        self._url_introduce = base_url + "/connectrpc.eliza.v1.ElizaService/Introduce"
 
     async def call_say(
         self, req: eliza_pb2.SayRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[eliza_pb2.SayResponse]:
         """Low-level method to call Say, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Say"
+        url = self._url_say
         return await self._connect_client.call_unary(url, req, eliza_pb2.SayResponse,extra_headers, timeout_seconds)
 
     async def say(
         self, req: eliza_pb2.SayRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> eliza_pb2.SayResponse:
-        response = await self.call_say(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(await self.call_say(req, extra_headers, timeout_seconds))
 
-    def converse(
+    async def converse(
         self, reqs: StreamInput[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncIterator[eliza_pb2.ConverseResponse]:
-        return self._converse_iterator(reqs, extra_headers, timeout_seconds)
-
-    async def _converse_iterator(
-        self, reqs: StreamInput[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> AsyncIterator[eliza_pb2.ConverseResponse]:
-        stream_output = await self.call_converse(reqs, extra_headers, timeout_seconds)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        async with stream_output as stream:
+        async with await self.call_converse(reqs, extra_headers, timeout_seconds) as stream:
             async for response in stream:
                 yield response
             err = stream.error()
@@ -168,24 +157,15 @@ class AsyncElizaServiceClient:
         self, reqs: StreamInput[eliza_pb2.ConverseRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncStreamOutput[eliza_pb2.ConverseResponse]:
         """Low-level method to call Converse, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Converse"
+        url = self._url_converse
         return await self._connect_client.call_bidirectional_streaming(
             url, reqs, eliza_pb2.ConverseResponse, extra_headers, timeout_seconds
         )
 
-    def introduce(
-        self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> AsyncIterator[eliza_pb2.IntroduceResponse]:
-        return self._introduce_iterator(req, extra_headers, timeout_seconds)
-
-    async def _introduce_iterator(
+    async def introduce(
         self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncIterator[eliza_pb2.IntroduceResponse]:
-        stream_output = await self.call_introduce(req, extra_headers)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        async with stream_output as stream:
+        async with await self.call_introduce(req, extra_headers, timeout_seconds) as stream:
             async for response in stream:
                 yield response
             err = stream.error()
@@ -196,7 +176,7 @@ class AsyncElizaServiceClient:
         self, req: eliza_pb2.IntroduceRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncStreamOutput[eliza_pb2.IntroduceResponse]:
         """Low-level method to call Introduce, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.eliza.v1.ElizaService/Introduce"
+        url = self._url_introduce
         return await self._connect_client.call_server_streaming(
             url, req, eliza_pb2.IntroduceResponse, extra_headers, timeout_seconds
         )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
 from typing import TypeVar
 
 import aiohttp
@@ -8,8 +11,6 @@ from google.protobuf.message import Message
 
 from .client_base import AsyncBaseClient
 from .client_connect import AsyncConnectProtocolClient
-from .client_grpc import AsyncConnectGRPCClient
-from .client_grpc_web import AsyncConnectGRPCWebClient
 from .client_protocol import ConnectProtocol
 from .connect_serialization import CONNECT_JSON_SERIALIZATION
 from .connect_serialization import CONNECT_PROTOBUF_SERIALIZATION
@@ -23,6 +24,31 @@ from .unary import UnaryOutput
 T = TypeVar("T", bound=Message)
 
 
+def _grpc_client(http_client: aiohttp.ClientSession) -> AsyncBaseClient:
+    # gRPC support is not implemented yet, so only import it on demand.
+    from .client_grpc import AsyncConnectGRPCClient
+
+    return AsyncConnectGRPCClient(http_client)
+
+
+def _grpc_web_client(http_client: aiohttp.ClientSession) -> AsyncBaseClient:
+    from .client_grpc_web import AsyncConnectGRPCWebClient
+
+    return AsyncConnectGRPCWebClient(http_client)
+
+
+_PROTOCOL_CLIENTS: dict[ConnectProtocol, Callable[[aiohttp.ClientSession], AsyncBaseClient]] = {
+    ConnectProtocol.CONNECT_PROTOBUF: functools.partial(
+        AsyncConnectProtocolClient, serialization=CONNECT_PROTOBUF_SERIALIZATION
+    ),
+    ConnectProtocol.CONNECT_JSON: functools.partial(
+        AsyncConnectProtocolClient, serialization=CONNECT_JSON_SERIALIZATION
+    ),
+    ConnectProtocol.GRPC: _grpc_client,
+    ConnectProtocol.GRPC_WEB: _grpc_web_client,
+}
+
+
 class AsyncConnectClient:
     _client: AsyncBaseClient
 
@@ -31,27 +57,7 @@ class AsyncConnectClient:
         http_client: aiohttp.ClientSession,
         protocol: ConnectProtocol = ConnectProtocol.CONNECT_PROTOBUF,
     ):
-        if protocol == ConnectProtocol.CONNECT_PROTOBUF:
-            self._client = AsyncConnectProtocolClient(http_client, CONNECT_PROTOBUF_SERIALIZATION)
-        elif protocol == ConnectProtocol.CONNECT_JSON:
-            self._client = AsyncConnectProtocolClient(http_client, CONNECT_JSON_SERIALIZATION)
-        elif protocol == ConnectProtocol.GRPC:
-            self._client = AsyncConnectGRPCClient(http_client)
-        elif protocol == ConnectProtocol.GRPC_WEB:
-            self._client = AsyncConnectGRPCWebClient(http_client)
-
-    def _to_async_iterator(self, input_stream: StreamInput[T]) -> AsyncIterator[T]:
-        """Convert various input types to AsyncIterator"""
-        # Check for async iteration first
-        if hasattr(input_stream, "__aiter__"):
-            return input_stream  # type: ignore[return-value]
-
-        # Fall back to sync iteration (covers lists, iterators, etc.)
-        async def _sync_to_async() -> AsyncIterator[T]:
-            for item in input_stream:
-                yield item
-
-        return _sync_to_async()
+        self._client = _PROTOCOL_CLIENTS[protocol](http_client)
 
     async def call_unary(
         self,
@@ -75,10 +81,9 @@ class AsyncConnectClient:
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
     ) -> ClientStreamingOutput[T]:
-        async_iter = self._to_async_iterator(reqs)
         stream_output = await self._client.call_streaming(
             url,
-            async_iter,
+            _request_messages(reqs),
             response_type,
             extra_headers=extra_headers,
             timeout_seconds=timeout_seconds,
@@ -92,16 +97,16 @@ class AsyncConnectClient:
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> AsyncStreamOutput[T]:
-        async def single_req() -> AsyncIterator[Message]:
-            yield req
-
-        return await self._client.call_streaming(
+        """reuse_message decodes every response into one shared message; see docs/usage.md."""
+        return await self._client.call_server_streaming(
             url,
-            single_req(),
+            req,
             response_type,
             extra_headers=extra_headers,
             timeout_seconds=timeout_seconds,
+            reuse_message=reuse_message,
         )
 
     async def call_bidirectional_streaming(
@@ -111,12 +116,43 @@ class AsyncConnectClient:
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> AsyncStreamOutput[T]:
-        async_iter = self._to_async_iterator(reqs)
+        """reuse_message decodes every response into one shared message; see docs/usage.md."""
         return await self._client.call_streaming(
             url,
-            async_iter,
+            _request_messages(reqs),
             response_type,
             extra_headers=extra_headers,
             timeout_seconds=timeout_seconds,
+            reuse_message=reuse_message,
         )
+
+
+def _request_messages(input_stream: StreamInput[T]) -> AsyncIterator[T] | list[T] | tuple[T, ...]:
+    # Lists and tuples are passed through as-is, so that the protocol
+    # client can send them as a single body.
+    if isinstance(input_stream, (list, tuple)):
+        return input_stream
+    return _to_async_iterator(input_stream)
+
+
+def _to_async_iterator(input_stream: StreamInput[T]) -> AsyncIterator[T]:
+    """Convert various input types to AsyncIterator"""
+    # Check for async iteration first. This is a plain attribute probe
+    # rather than isinstance(input_stream, AsyncIterable): ABC instance
+    # checks go through __instancecheck__ and are several times slower.
+    if hasattr(input_stream, "__aiter__"):
+        return input_stream  # type: ignore[return-value]
+
+    # Fall back to sync iteration (covers lists, iterators, etc.)
+    return _sync_to_async(input_stream)
+
+
+async def _sync_to_async(input_stream: Iterable[T]) -> AsyncIterator[T]:
+    # CPython's async generators are cheaper per item than a class with
+    # an `async def __anext__`, which creates a fresh coroutine for
+    # every message, so keep this as a generator - but define it once
+    # here rather than as a new closure on each call.
+    for item in input_stream:
+        yield item
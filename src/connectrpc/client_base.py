@@ -30,6 +30,17 @@ class BaseClient(Protocol):
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> StreamOutput[T]: ...
+
+    def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> StreamOutput[T]: ...
 
 
@@ -46,8 +57,19 @@ class AsyncBaseClient(Protocol):
     async def call_streaming(
         self,
         url: str,
-        reqs: AsyncIterator[Message],
+        reqs: AsyncIterator[Message] | list[Message] | tuple[Message, ...],
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> AsyncStreamOutput[T]: ...
+
+    async def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> AsyncStreamOutput[T]: ...
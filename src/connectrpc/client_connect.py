@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import struct
+import asyncio
+import functools
 from collections.abc import AsyncIterator
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Mapping
 from typing import Any
 from typing import TypeVar
 
 import aiohttp
 import urllib3
+from aiohttp import hdrs
 from google.protobuf.message import Message
 from multidict import CIMultiDict
 
@@ -17,12 +21,17 @@ from .client_base import BaseClient
 from .connect_serialization import CONNECT_PROTOBUF_SERIALIZATION
 from .connect_serialization import ConnectSerialization
 from .errors import ConnectError
+from .errors import infer_connect_code_from_http_status
 from .headers import HeaderInput
 from .headers import merge_headers
 from .headers import multidict_to_urllib3
 from .io import StreamReader
+from .io import copy_frame
 from .streams import AsyncStreamOutput
 from .streams import StreamOutput
+from .streams_connect import ENVELOPE
+from .streams_connect import FLAG_COMPRESSED
+from .streams_connect import FLAG_END_STREAM
 from .streams_connect import EndStreamResponse
 from .unary import UnaryOutput
 
@@ -37,6 +46,16 @@ class ConnectProtocolClient(BaseClient):
     ):
         self.http_client = http_client
         self.serde = serialization
+        self._serialize = serialization.serializer()
+        self._parser = serialization.parser
+        self._unary_content_type = serialization.unary_content_type
+        self._streaming_content_type = serialization.streaming_content_type
+        self._unary_headers = _base_headers(self._unary_content_type)
+        self._streaming_headers = _base_headers(self._streaming_content_type)
+        # urllib3 wants its own header type, so keep converted copies of
+        # the templates for requests that add nothing to them.
+        self._unary_urllib3_headers = multidict_to_urllib3(self._unary_headers)
+        self._streaming_urllib3_headers = multidict_to_urllib3(self._streaming_headers)
 
     def call_unary(
         self,
@@ -46,19 +65,13 @@ class ConnectProtocolClient(BaseClient):
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
     ) -> UnaryOutput[T]:
-        data = self.serde.serialize(req)
-        headers = CIMultiDict(
-            [
-                ("Content-Type", self.serde.unary_content_type),
-                ("Connect-Protocol-Version", "1"),
-            ]
-        )
-        headers = merge_headers(headers, extra_headers)
-
-        if timeout_seconds is not None and timeout_seconds > 0:
-            headers["Connect-Timeout-Ms"] = str(int(timeout_seconds * 1000))
+        data = self._serialize(req)
+        headers = _request_headers(self._unary_headers, extra_headers, timeout_seconds)
+        if headers is self._unary_headers:
+            headers_dict = self._unary_urllib3_headers
+        else:
+            headers_dict = multidict_to_urllib3(headers)
 
-        headers_dict = multidict_to_urllib3(headers)
         resp = self.http_client.request(
             "POST",
             url,
@@ -71,21 +84,20 @@ class ConnectProtocolClient(BaseClient):
             retries=False,
         )
 
-        output: ConnectUnaryOutput[T] = ConnectUnaryOutput(
-            response_headers=CIMultiDict(resp.headers)
-        )
+        output: ConnectUnaryOutput[T] = ConnectUnaryOutput(response_headers=resp.headers)
 
         if resp.status != 200:
             body = resp.read()
             output._error = ConnectError.from_http_response(resp.status, body)
             return output
 
-        if resp.headers["Content-Type"] != self.serde.unary_content_type:
-            raise UnexpectedContentType(resp.headers["Content-Type"])
+        content_type = resp.headers["Content-Type"]
+        if content_type != self._unary_content_type:
+            raise UnexpectedContentType(content_type)
 
         try:
             body = resp.read()
-            response_msg = self.serde.deserialize(body, response_type)
+            response_msg = self._parser(response_type)(body)
         except Exception as e:
             from .errors import ConnectErrorCode
 
@@ -104,29 +116,70 @@ class ConnectProtocolClient(BaseClient):
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> StreamOutput[T]:
-        headers = CIMultiDict(
-            [
-                ("Content-Type", self.serde.streaming_content_type),
-                ("Connect-Protocol-Version", "1"),
-            ]
-        )
-        headers = merge_headers(headers, extra_headers)
+        if isinstance(reqs, (list, tuple)):
+            return self._send_streaming(
+                url,
+                _encode_messages(self._serialize, reqs),
+                response_type,
+                extra_headers,
+                timeout_seconds,
+                reuse_message,
+            )
+
+        serialize = self._serialize
+        pack = ENVELOPE.pack
 
         def encoded_stream() -> Iterable[bytes]:
             for msg in reqs:
-                encoded = self.serde.serialize(msg)
-                envelope = struct.pack(">BI", 0, len(encoded))
-                yield envelope + encoded
+                encoded = serialize(msg)
+                yield pack(0, len(encoded)) + encoded
+
+        return self._send_streaming(
+            url, encoded_stream(), response_type, extra_headers, timeout_seconds, reuse_message
+        )
+
+    def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> StreamOutput[T]:
+        # With exactly one request message, the body can be framed up
+        # front and sent with a Content-Length.
+        encoded = self._serialize(req)
+        return self._send_streaming(
+            url,
+            ENVELOPE.pack(0, len(encoded)) + encoded,
+            response_type,
+            extra_headers,
+            timeout_seconds,
+            reuse_message,
+        )
 
-        if timeout_seconds is not None and timeout_seconds > 0:
-            headers["Connect-Timeout-Ms"] = str(int(timeout_seconds * 1000))
+    def _send_streaming(
+        self,
+        url: str,
+        body: bytes | Iterable[bytes],
+        response_type: type[T],
+        extra_headers: HeaderInput | None,
+        timeout_seconds: float | None,
+        reuse_message: bool,
+    ) -> StreamOutput[T]:
+        headers = _request_headers(self._streaming_headers, extra_headers, timeout_seconds)
+        if headers is self._streaming_headers:
+            headers_dict = self._streaming_urllib3_headers
+        else:
+            headers_dict = multidict_to_urllib3(headers)
 
-        headers_dict = multidict_to_urllib3(headers)
         resp = self.http_client.request(
             "POST",
             url,
-            body=encoded_stream(),
+            body=body,
             headers=headers_dict,
             timeout=timeout_seconds,
             decode_content=False,
@@ -135,10 +188,11 @@ class ConnectProtocolClient(BaseClient):
             retries=False,
             release_conn=False,
         )
-        if resp.headers["Content-Type"] != self.serde.streaming_content_type:
-            raise UnexpectedContentType(resp.headers["Content-Type"])
+        content_type = resp.headers["Content-Type"]
+        if content_type != self._streaming_content_type:
+            raise UnexpectedContentType(content_type)
 
-        stream_output = ConnectStreamOutput(resp, response_type, self.serde)
+        stream_output = ConnectStreamOutput(resp, response_type, self.serde, reuse_message)
         if resp.status != 200:
             body = resp.read()
             stream_output._abort_with_error(ConnectError.from_http_response(resp.status, body))
@@ -153,6 +207,12 @@ class AsyncConnectProtocolClient(AsyncBaseClient):
     ):
         self._http_client = http_client
         self.serde = serialization
+        self._serialize = serialization.serializer()
+        self._parser = serialization.parser
+        self._unary_content_type = serialization.unary_content_type
+        self._streaming_content_type = serialization.streaming_content_type
+        self._unary_headers = _base_headers(self._unary_content_type)
+        self._streaming_headers = _base_headers(self._streaming_content_type)
 
     async def call_unary(
         self,
@@ -162,37 +222,26 @@ class AsyncConnectProtocolClient(AsyncBaseClient):
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
     ) -> UnaryOutput[T]:
-        data = self.serde.serialize(req)
-        headers = CIMultiDict(
-            [
-                ("Content-Type", self.serde.unary_content_type),
-                ("Connect-Protocol-Version", "1"),
-            ]
-        )
-        headers = merge_headers(headers, extra_headers)
+        data = self._serialize(req)
+        headers = _request_headers(self._unary_headers, extra_headers, timeout_seconds)
 
-        if timeout_seconds is not None and timeout_seconds > 0:
-            headers["Connect-Timeout-Ms"] = str(int(timeout_seconds * 1000))
-            timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-        else:
-            timeout = aiohttp.ClientTimeout(total=None)
+        timeout = _client_timeout(timeout_seconds)
 
         async with self._http_client.request(
             "POST", url, data=data, headers=headers, timeout=timeout
         ) as resp:
-            output: ConnectUnaryOutput[T] = ConnectUnaryOutput(
-                response_headers=CIMultiDict(resp.headers)
-            )
+            output: ConnectUnaryOutput[T] = ConnectUnaryOutput(response_headers=resp.headers)
             if resp.status != 200:
                 output._error = await self.unary_error(resp)
                 return output
 
-            if resp.headers["Content-Type"] != self.serde.unary_content_type:
-                raise UnexpectedContentType(resp.headers["Content-Type"])
+            content_type = resp.headers[hdrs.CONTENT_TYPE]
+            if content_type != self._unary_content_type:
+                raise UnexpectedContentType(content_type)
 
             try:
                 body = await resp.read()
-                response_msg = self.serde.deserialize(body, response_type)
+                response_msg = self._parser(response_type)(body)
             except Exception as e:
                 from .errors import ConnectErrorCode
 
@@ -205,88 +254,230 @@ class AsyncConnectProtocolClient(AsyncBaseClient):
     async def call_streaming(
         self,
         url: str,
-        reqs: AsyncIterator[Message],
+        reqs: AsyncIterator[Message] | list[Message] | tuple[Message, ...],
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> AsyncStreamOutput[T]:
-        headers = CIMultiDict(
-            [
-                ("Content-Type", self.serde.streaming_content_type),
-                ("Connect-Protocol-Version", "1"),
-            ]
-        )
-        headers = merge_headers(headers, extra_headers)
+        if isinstance(reqs, (list, tuple)):
+            return await self._send_streaming(
+                url,
+                _encode_messages(self._serialize, reqs),
+                response_type,
+                extra_headers,
+                timeout_seconds,
+                reuse_message,
+            )
+
+        serialize = self._serialize
+        pack = ENVELOPE.pack
 
         async def encoded_stream() -> AsyncIterator[bytes]:
             async for msg in reqs:
-                encoded = self.serde.serialize(msg)
-                envelope = struct.pack(">BI", 0, len(encoded))
-                yield envelope + encoded
+                encoded = serialize(msg)
+                yield pack(0, len(encoded)) + encoded
 
-        payload = aiohttp.AsyncIterablePayload(encoded_stream())
+        return await self._send_streaming(
+            url,
+            aiohttp.AsyncIterablePayload(encoded_stream()),
+            response_type,
+            extra_headers,
+            timeout_seconds,
+            reuse_message,
+        )
 
-        if timeout_seconds is not None and timeout_seconds > 0:
-            headers["Connect-Timeout-Ms"] = str(int(timeout_seconds * 1000))
-            timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-        else:
-            timeout = aiohttp.ClientTimeout(total=None)
+    async def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> AsyncStreamOutput[T]:
+        # With exactly one request message, the body can be framed up
+        # front and sent with a Content-Length.
+        encoded = self._serialize(req)
+        return await self._send_streaming(
+            url,
+            ENVELOPE.pack(0, len(encoded)) + encoded,
+            response_type,
+            extra_headers,
+            timeout_seconds,
+            reuse_message,
+        )
+
+    async def _send_streaming(
+        self,
+        url: str,
+        data: bytes | aiohttp.AsyncIterablePayload,
+        response_type: type[T],
+        extra_headers: HeaderInput | None,
+        timeout_seconds: float | None,
+        reuse_message: bool,
+    ) -> AsyncStreamOutput[T]:
+        headers = _request_headers(self._streaming_headers, extra_headers, timeout_seconds)
+
+        timeout = _client_timeout(timeout_seconds)
 
         http_response = await self._http_client.request(
-            "POST", url, data=payload, headers=headers, timeout=timeout
+            "POST", url, data=data, headers=headers, timeout=timeout
         )
-        if http_response.headers["Content-Type"] != self.serde.streaming_content_type:
+        content_type = http_response.headers[hdrs.CONTENT_TYPE]
+        if content_type != self._streaming_content_type:
             await http_response.release()
-            raise UnexpectedContentType(http_response.headers["Content-Type"])
+            raise UnexpectedContentType(content_type)
 
-        stream_output = ConnectAsyncStreamOutput(http_response, response_type, self.serde)
+        stream_output = ConnectAsyncStreamOutput(
+            http_response, response_type, self.serde, reuse_message
+        )
         if http_response.status != 200:
-            txt = await http_response.text()
-            await stream_output._abort_with_error(
-                ConnectError.from_http_response(http_response.status, txt)
-            )
+            await stream_output._abort_with_error(await self.unary_error(http_response))
         return stream_output
 
     async def unary_error(self, resp: aiohttp.ClientResponse) -> ConnectError:
-        txt = await resp.text()
-        return ConnectError.from_http_response(resp.status, txt)
+        body = await _read_error_body(resp.content)
+        if body is None:
+            # The rest of the body may be arbitrarily long, or never end, so
+            # drop the connection rather than reading it.
+            resp.close()
+            return ConnectError(
+                infer_connect_code_from_http_status(resp.status),
+                f"HTTP {resp.status}: error response body is larger than "
+                f"{_MAX_ERROR_BODY} bytes, so it was not parsed",
+                http_status=resp.status,
+            )
+        return ConnectError.from_http_response(resp.status, body)
+
+
+# Error responses are read into memory and parsed as JSON; don't let a
+# misbehaving server make that arbitrarily expensive. Bodies longer than
+# this are not parsed.
+_MAX_ERROR_BODY = 1 << 20
+
+
+async def _read_error_body(content: aiohttp.StreamReader) -> bytes | None:
+    """Reads an error response body, or returns None as soon as it's known
+    to be longer than _MAX_ERROR_BODY.
+    """
+    body = bytearray()
+    while len(body) <= _MAX_ERROR_BODY:
+        chunk = await content.read(_MAX_ERROR_BODY + 1 - len(body))
+        if not chunk:
+            return bytes(body)
+        body += chunk
+    return None
+
+
+def _encode_messages(serialize: Callable[[Message], bytes], msgs: Iterable[Message]) -> bytes:
+    """Frames messages which are all available up front into a single
+    request body.
+
+    Sending that as one write with a Content-Length is cheaper than a
+    write per message, and since nothing is waiting on a producer it
+    delays nothing. The body is byte-for-byte what the streamed path
+    sends; the difference is that serialization errors are raised
+    before the request starts.
+    """
+    pack = ENVELOPE.pack
+    frames = []
+    for msg in msgs:
+        encoded = serialize(msg)
+        frames.append(pack(0, len(encoded)))
+        frames.append(encoded)
+    return b"".join(frames)
+
+
+# ClientTimeout is immutable, so calls without a deadline can share one.
+_NO_TIMEOUT = aiohttp.ClientTimeout(total=None)
+
+
+def _client_timeout(timeout_seconds: float | None) -> aiohttp.ClientTimeout:
+    if timeout_seconds is not None and timeout_seconds > 0:
+        return aiohttp.ClientTimeout(total=timeout_seconds)
+    return _NO_TIMEOUT
+
+
+@functools.lru_cache(maxsize=64)
+def _timeout_ms(timeout_seconds: float) -> str:
+    """Formats a timeout for the Connect-Timeout-Ms header.
+
+    Callers tend to use the same few deadlines over and over, so the
+    formatted values are cached.
+    """
+    return str(int(timeout_seconds * 1000))
+
+
+def _base_headers(content_type: str) -> CIMultiDict[str]:
+    # Built once per client and shared by its requests; see
+    # _request_headers. It must never be mutated.
+    return CIMultiDict([("Content-Type", content_type), ("Connect-Protocol-Version", "1")])
+
+
+def _request_headers(
+    base: CIMultiDict[str], extra_headers: HeaderInput | None, timeout_seconds: float | None
+) -> CIMultiDict[str]:
+    """Returns the headers to send with a request.
+
+    Most requests add nothing to the client's base headers, so those
+    share base itself rather than a copy. Callers must not mutate the
+    result.
+    """
+    if timeout_seconds is not None and timeout_seconds > 0:
+        headers = merge_headers(base, extra_headers)
+        headers["Connect-Timeout-Ms"] = _timeout_ms(timeout_seconds)
+        return headers
+    if extra_headers is None:
+        return base
+    return merge_headers(base, extra_headers)
 
 
 class ConnectUnaryOutput(UnaryOutput[T]):
-    def __init__(self, response_headers: CIMultiDict[str], message: T | None = None):
+    __slots__ = (
+        "_message",
+        "_raw_headers",
+        "_response_headers",
+        "_response_trailers",
+        "_error",
+    )
+
+    def __init__(self, response_headers: Mapping[str, str], message: T | None = None):
         self._message = message
-        self._response_headers = response_headers
+        # Many callers never look at the headers, so only split them into
+        # headers and trailers when asked.
+        self._raw_headers = response_headers
+        self._response_headers: CIMultiDict[str] | None = None
+        self._response_trailers: CIMultiDict[str] | None = None
         self._error: ConnectError | None = None
 
     def message(self) -> T | None:
         return self._message
 
     def response_headers(self) -> CIMultiDict[str]:
-        trailers: CIMultiDict[str] = CIMultiDict()
-
-        for key, value in self._response_headers.items():
-            key_clean = str(key).lower()
-            if key_clean.startswith("trailer-"):
-                # Strip 'trailer-' prefix
-                key_new = key_clean.removeprefix("trailer-")
-                trailers.add(key_new, value)
-
+        if self._response_headers is None:
+            self._response_headers, self._response_trailers = self._split_headers()
         return self._response_headers
 
     def error(self) -> ConnectError | None:
         return self._error
 
     def response_trailers(self) -> CIMultiDict[str]:
-        # Connect Unary responses encode trailers in headers
-        trailers: CIMultiDict[str] = CIMultiDict()
-        for key, value in self._response_headers.items():
-            key_clean = str(key).lower()
-            if key_clean.startswith("trailer-"):
-                # Strip 'trailer-' prefix
-                key_new = key_clean.removeprefix("trailer-")
-                trailers.add(key_new, value)
+        if self._response_trailers is None:
+            self._response_headers, self._response_trailers = self._split_headers()
+        return self._response_trailers
 
-        return trailers
+    def _split_headers(self) -> tuple[CIMultiDict[str], CIMultiDict[str]]:
+        # Connect Unary responses encode trailers in headers, with a
+        # 'trailer-' prefix. Separate the two in a single pass.
+        headers: CIMultiDict[str] = CIMultiDict()
+        trailers: CIMultiDict[str] = CIMultiDict()
+        for key, value in self._raw_headers.items():
+            if key[:8].lower() == "trailer-":
+                trailers.add(key[8:].lower(), value)
+            else:
+                headers.add(key, value)
+        return headers, trailers
 
 
 class ConnectStreamOutput(StreamOutput[T]):
@@ -294,6 +485,20 @@ class ConnectStreamOutput(StreamOutput[T]):
     protobuf-encoded streaming response.
     """
 
+    __slots__ = (
+        "_reader",
+        "_response_type",
+        "_serde",
+        "_parse",
+        "_raw_headers",
+        "_response_headers",
+        "_response_trailers",
+        "_error",
+        "_response",
+        "_consumed",
+        "_released",
+    )
+
     # Size of a read during streaming
     READ_CHUNK_SIZE = 8192
 
@@ -302,14 +507,15 @@ class ConnectStreamOutput(StreamOutput[T]):
         response: urllib3.BaseHTTPResponse,
         response_type: type[T],
         serde: ConnectSerialization,
+        reuse_message: bool = False,
     ):
         self._reader = StreamReader(response, None)
         self._response_type = response_type
         self._serde = serde
+        self._parse = serde.parser(response_type, reuse_message)
 
-        self._buffer: bytearray = bytearray()
-
-        self._response_headers = CIMultiDict(response.headers)
+        self._raw_headers = response.headers
+        self._response_headers: CIMultiDict[str] | None = None
         self._response_trailers: CIMultiDict[str] = CIMultiDict()
         self._error: ConnectError | None = None
 
@@ -326,15 +532,21 @@ class ConnectStreamOutput(StreamOutput[T]):
         self.close()
 
     def __next__(self) -> T:
-        if self._consumed or self._released:
+        # Reaching the end of the stream closes it, so this also covers
+        # streams which have been consumed.
+        if self._released:
             raise StopIteration
-        envelope = self._reader.readexactly(5)
-        if envelope[0] & 1:
+        frame = self._reader.read_frame()
+        if frame is None:
+            raise EOFError
+        flags, encoded = frame
+        if flags & FLAG_COMPRESSED:
             # message is compressed, which we dont currently handle
             raise NotImplementedError("cant handle compressed messages yet")
-        if envelope[0] & 2:
-            # This is an EndStreamResponse
-            encoded = self._reader.readall()
+        if flags & FLAG_END_STREAM:
+            # This is an EndStreamResponse. Nothing should follow it, but
+            # drain the body anyway so the connection can be reused.
+            self._reader.readall()
             end_stream_response = EndStreamResponse.from_bytes(encoded)
 
             if end_stream_response.error is not None:
@@ -346,9 +558,7 @@ class ConnectStreamOutput(StreamOutput[T]):
             self.close()
             raise StopIteration
 
-        length = struct.unpack(">I", envelope[1:5])[0]
-        encoded = self._reader.readexactly(length)
-        return self._serde.deserialize(bytes(encoded), self._response_type)
+        return self._parse(encoded)
 
     def __iter__(self) -> Iterator[T]:
         return self
@@ -366,6 +576,8 @@ class ConnectStreamOutput(StreamOutput[T]):
 
     def response_headers(self) -> CIMultiDict[str]:
         """Get HTTP response headers from the initial response."""
+        if self._response_headers is None:
+            self._response_headers = CIMultiDict(self._raw_headers)
         return self._response_headers
 
     def response_trailers(self) -> CIMultiDict[str]:
@@ -375,8 +587,8 @@ class ConnectStreamOutput(StreamOutput[T]):
 
     def close(self) -> None:
         if not self._released:
-            self._response.release_conn()
             self._released = True
+            self._response.release_conn()
 
     def done(self) -> bool:
         return self._consumed
@@ -391,15 +603,42 @@ class ConnectAsyncStreamOutput(AsyncStreamOutput[T]):
 
     """
 
+    __slots__ = (
+        "_response",
+        "_response_type",
+        "_serde",
+        "_parse",
+        "_raw_headers",
+        "_response_headers",
+        "_response_body",
+        "_buffer",
+        "_response_trailers",
+        "_error",
+        "_consumed",
+        "_released",
+    )
+
     def __init__(
-        self, response: aiohttp.ClientResponse, response_type: type[T], serde: ConnectSerialization
+        self,
+        response: aiohttp.ClientResponse,
+        response_type: type[T],
+        serde: ConnectSerialization,
+        reuse_message: bool = False,
     ):
         self._response = response
         self._response_type = response_type
         self._serde = serde
+        self._parse = serde.parser(response_type, reuse_message)
 
-        self._response_headers = CIMultiDict(response.headers)  # Capture HTTP response headers
+        # Copied into a CIMultiDict on first use; aiohttp keeps the
+        # headers after the response is released.
+        self._raw_headers = response.headers
+        self._response_headers: CIMultiDict[str] | None = None
         self._response_body = response.content
+        # Data read from the response body that hasn't been parsed yet.
+        # A single network read usually holds several small messages, so
+        # we buffer here and only await the body when this runs dry.
+        self._buffer = bytearray()
         self._response_trailers: CIMultiDict[str] = CIMultiDict()
         self._error: ConnectError | None = None
 
@@ -412,16 +651,38 @@ class ConnectAsyncStreamOutput(AsyncStreamOutput[T]):
         self._error = ConnectError(ConnectErrorCode.INTERNAL, str(err))
         await self.close()
 
+    async def _fill_buffer(self, n: int) -> None:
+        """Read from the response body until the buffer holds at least n bytes."""
+        buf = self._buffer
+        readany = self._response_body.readany
+        while len(buf) < n:
+            chunk = await readany()
+            if not chunk:
+                raise asyncio.IncompleteReadError(bytes(buf), n)
+            buf += chunk
+
     async def __anext__(self) -> T:
-        if self._consumed or self._released:
+        # Reaching the end of the stream closes it, so this also covers
+        # streams which have been consumed.
+        if self._released:
             raise StopAsyncIteration
-        envelope = await self._response_body.readexactly(5)
-        if envelope[0] & 1:
+        buf = self._buffer
+        if len(buf) < ENVELOPE.size:
+            await self._fill_buffer(ENVELOPE.size)
+        flags, length = ENVELOPE.unpack_from(buf)
+        if flags & FLAG_COMPRESSED:
             # message is compressed, which we dont currently handle
             raise NotImplementedError("cant handle compressed messages yet")
-        if envelope[0] & 2:
-            # This is an EndStreamResponse
-            encoded = await self._response_body.read(-1)
+        if flags & FLAG_END_STREAM:
+            # This is an EndStreamResponse. Parse the length the envelope
+            # declares; nothing should follow it, but drain the body anyway
+            # so that aiohttp can reuse the connection.
+            end = ENVELOPE.size + length
+            if len(buf) < end:
+                await self._fill_buffer(end)
+            encoded = bytes(buf[ENVELOPE.size : end])
+            buf.clear()
+            await self._response_body.read(-1)
             end_stream_response = EndStreamResponse.from_bytes(encoded)
 
             if end_stream_response.error is not None:
@@ -434,15 +695,20 @@ class ConnectAsyncStreamOutput(AsyncStreamOutput[T]):
 
             raise StopAsyncIteration
 
-        length = struct.unpack(">I", envelope[1:5])[0]
-        encoded = await self._response_body.readexactly(length)
-        return self._serde.deserialize(encoded, self._response_type)
+        end = ENVELOPE.size + length
+        if len(buf) < end:
+            await self._fill_buffer(end)
+        encoded = copy_frame(buf, ENVELOPE.size, end)
+        del buf[:end]
+        return self._parse(encoded)
 
     def __aiter__(self) -> AsyncIterator[T]:
         return self
 
     def response_headers(self) -> CIMultiDict[str]:
         """Get HTTP response headers from the initial response."""
+        if self._response_headers is None:
+            self._response_headers = CIMultiDict(self._raw_headers)
         return self._response_headers
 
     def response_trailers(self) -> CIMultiDict[str]:
@@ -37,6 +37,18 @@ class ConnectGRPCClient(BaseClient):
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> StreamOutput[T]:
+        raise NotImplementedError
+
+    def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> StreamOutput[T]:
         raise NotImplementedError
 
@@ -58,9 +70,21 @@ class AsyncConnectGRPCClient(AsyncBaseClient):
     async def call_streaming(
         self,
         url: str,
-        reqs: AsyncIterator[Message],
+        reqs: AsyncIterator[Message] | list[Message] | tuple[Message, ...],
+        response_type: type[T],
+        extra_headers: HeaderInput | None = None,
+        timeout_seconds: float | None = None,
+        reuse_message: bool = False,
+    ) -> AsyncStreamOutput[T]:
+        raise NotImplementedError
+
+    async def call_server_streaming(
+        self,
+        url: str,
+        req: Message,
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> AsyncStreamOutput[T]:
         raise NotImplementedError
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import functools
+import socket
+from collections.abc import Callable
 from collections.abc import Iterable
 from typing import TypeVar
 
 import urllib3
 from google.protobuf.message import Message
+from urllib3.connection import HTTPConnection
 
 from .client_base import BaseClient
 from .client_connect import ConnectProtocolClient
-from .client_grpc import ConnectGRPCClient
-from .client_grpc_web import ConnectGRPCWebClient
 from .client_protocol import ConnectProtocol
 from .connect_serialization import CONNECT_JSON_SERIALIZATION
 from .connect_serialization import CONNECT_PROTOBUF_SERIALIZATION
@@ -21,6 +23,31 @@ from .unary import UnaryOutput
 T = TypeVar("T", bound=Message)
 
 
+def _grpc_client(http_client: urllib3.PoolManager) -> BaseClient:
+    # gRPC support is not implemented yet, so only import it on demand.
+    from .client_grpc import ConnectGRPCClient
+
+    return ConnectGRPCClient(http_client)
+
+
+def _grpc_web_client(http_client: urllib3.PoolManager) -> BaseClient:
+    from .client_grpc_web import ConnectGRPCWebClient
+
+    return ConnectGRPCWebClient(http_client)
+
+
+_PROTOCOL_CLIENTS: dict[ConnectProtocol, Callable[[urllib3.PoolManager], BaseClient]] = {
+    ConnectProtocol.CONNECT_PROTOBUF: functools.partial(
+        ConnectProtocolClient, serialization=CONNECT_PROTOBUF_SERIALIZATION
+    ),
+    ConnectProtocol.CONNECT_JSON: functools.partial(
+        ConnectProtocolClient, serialization=CONNECT_JSON_SERIALIZATION
+    ),
+    ConnectProtocol.GRPC: _grpc_client,
+    ConnectProtocol.GRPC_WEB: _grpc_web_client,
+}
+
+
 class ConnectClient:
     _client: BaseClient
     protocol: ConnectProtocol
@@ -29,20 +56,29 @@ class ConnectClient:
         self,
         http_client: urllib3.PoolManager | None = None,
         protocol: ConnectProtocol = ConnectProtocol.CONNECT_PROTOBUF,
+        tcp_nodelay: bool = True,
     ):
+        """Create a client.
+
+        Args:
+            http_client: Connection pool to send requests through. If
+                None, a PoolManager shared by every ConnectClient in the
+                process is used, so that connections are reused even
+                when clients are short-lived.
+            protocol: The wire protocol to use.
+            tcp_nodelay: Whether to disable Nagle's algorithm on the
+                sockets of the shared PoolManager used when http_client
+                is None, and TCP_QUICKACK where the platform has it.
+                Small unary RPCs are latency-bound, so this is on by
+                default; bulk streaming users may prefer to turn it off.
+                Ignored if http_client is provided.
+        """
         self.protocol = protocol
 
         if http_client is None:
-            http_client = urllib3.PoolManager()
+            http_client = _default_pool_manager(tcp_nodelay)
 
-        if protocol == ConnectProtocol.CONNECT_PROTOBUF:
-            self._client = ConnectProtocolClient(http_client, CONNECT_PROTOBUF_SERIALIZATION)
-        elif protocol == ConnectProtocol.CONNECT_JSON:
-            self._client = ConnectProtocolClient(http_client, CONNECT_JSON_SERIALIZATION)
-        elif protocol == ConnectProtocol.GRPC:
-            self._client = ConnectGRPCClient(http_client)
-        elif protocol == ConnectProtocol.GRPC_WEB:
-            self._client = ConnectGRPCWebClient(http_client)
+        self._client = _PROTOCOL_CLIENTS[protocol](http_client)
 
     def call_unary(
         self,
@@ -80,13 +116,16 @@ class ConnectClient:
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> StreamOutput[T]:
-        return self._client.call_streaming(
+        """reuse_message decodes every response into one shared message; see docs/usage.md."""
+        return self._client.call_server_streaming(
             url,
-            [req],
+            req,
             response_type,
             extra_headers=extra_headers,
             timeout_seconds=timeout_seconds,
+            reuse_message=reuse_message,
         )
 
     def call_bidirectional_streaming(
@@ -96,11 +135,46 @@ class ConnectClient:
         response_type: type[T],
         extra_headers: HeaderInput | None = None,
         timeout_seconds: float | None = None,
+        reuse_message: bool = False,
     ) -> StreamOutput[T]:
+        """reuse_message decodes every response into one shared message; see docs/usage.md."""
         return self._client.call_streaming(
             url,
             reqs,
             response_type,
             extra_headers=extra_headers,
             timeout_seconds=timeout_seconds,
+            reuse_message=reuse_message,
         )
+
+
+# Idle connections kept per host by the shared PoolManager. This is
+# shared across threads, so keep more than urllib3's default of 1.
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@functools.cache
+def _default_pool_manager(tcp_nodelay: bool) -> urllib3.PoolManager:
+    return urllib3.PoolManager(
+        maxsize=DEFAULT_POOL_MAXSIZE, socket_options=_socket_options(tcp_nodelay)
+    )
+
+
+def _socket_options(tcp_nodelay: bool) -> list[tuple[int, int, int]]:
+    """Socket options for the shared default PoolManager.
+
+    urllib3's defaults already set TCP_NODELAY; we spell it out so that
+    it can be switched off, and so it doesn't silently change under us.
+    """
+    options = [
+        opt
+        for opt in HTTPConnection.default_socket_options
+        if opt[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    ]
+    options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if tcp_nodelay else 0))
+    if tcp_nodelay and hasattr(socket, "TCP_QUICKACK"):
+        # Linux only. The kernel drops back to delayed ACKs on its own
+        # after a while, so this mainly speeds up the first exchanges on
+        # a new connection, but it costs nothing.
+        options.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+    return options
@@ -4,8 +4,26 @@ import zlib
 from collections.abc import Callable
 from collections.abc import Iterable
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Protocol
 
+try:
+    # python-isal (connect-python[gzip]) provides a zlib-compatible module
+    # built on Intel's ISA-L, which is considerably faster at gzip. It's only
+    # used to decompress: its compressor supports levels 0-3 and defaults to
+    # 2, not zlib's 6, so compressing with it would send larger payloads.
+    from isal import isal_zlib
+
+    _gzip_decompressobj: Callable[..., Decompressor] = isal_zlib.decompressobj
+    _gzip_decompress_impl: Callable[[bytes, int], bytes] = isal_zlib.decompress
+    # isal raises its own IsalError; it's re-raised as zlib.error. (isal's
+    # stubs declare the exception as an instance, hence the ignore.)
+    _GZIP_ERRORS: tuple[type[Exception], ...] = (isal_zlib.error,)  # type: ignore[assignment]
+except ImportError:
+    _gzip_decompressobj = zlib.decompressobj
+    _gzip_decompress_impl = zlib.decompress
+    _GZIP_ERRORS = ()
+
 
 class Decompressor(Protocol):
     def decompress(self, data: bytes) -> bytes: ...
@@ -30,6 +48,22 @@ class CompressionCodec:
     label: str
     compressor: Callable[[], Compressor]
     decompressor: Callable[[], Decompressor]
+    # Decompresses one complete payload in a single call, without
+    # setting up a Decompressor. Optional; see decompress.
+    decompress_fn: Callable[[bytes], bytes] | None = None
+    # Streams check this for every message, so compare the label once.
+    is_identity: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.is_identity = self.label == "identity"
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses a complete payload, such as an individually
+        compressed stream message.
+        """
+        if self.decompress_fn is not None:
+            return self.decompress_fn(data)
+        return self.decompressor().decompress(data)
 
 
 class IdentityCompressor:
@@ -50,10 +84,13 @@ IdentityCodec = CompressionCodec("identity", IdentityCompressor, IdentityDecompr
 
 class GzipDecompressor:
     def __init__(self) -> None:
-        self.decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        self.decompressor = _gzip_decompressobj(wbits=zlib.MAX_WBITS | 16)
 
     def decompress(self, data: bytes) -> bytes:
-        return self.decompressor.decompress(data)
+        try:
+            return self.decompressor.decompress(data)
+        except _GZIP_ERRORS as e:
+            raise zlib.error(*e.args) from e
 
 
 class GzipCompressor:
@@ -67,7 +104,14 @@ class GzipCompressor:
         return self.compressor.flush()
 
 
-GzipCodec = CompressionCodec("gzip", GzipCompressor, GzipDecompressor)
+def _gzip_decompress(data: bytes) -> bytes:
+    try:
+        return _gzip_decompress_impl(data, zlib.MAX_WBITS | 16)
+    except _GZIP_ERRORS as e:
+        raise zlib.error(*e.args) from e
+
+
+GzipCodec = CompressionCodec("gzip", GzipCompressor, GzipDecompressor, _gzip_decompress)
 
 SUPPORTED_COMPRESSIONS = {"identity": IdentityCodec, "gzip": GzipCodec}
 
@@ -86,7 +130,7 @@ try:
         def decompress(self, data: bytes) -> bytes:
             return brotli.decompress(data)  # type: ignore[no-any-return]
 
-    BrotliCodec = CompressionCodec("br", BrotliCompressor, BrotliDecompressor)
+    BrotliCodec = CompressionCodec("br", BrotliCompressor, BrotliDecompressor, brotli.decompress)
     SUPPORTED_COMPRESSIONS["br"] = BrotliCodec
 
 except ImportError:
@@ -111,7 +155,7 @@ try:
         def decompress(self, data: bytes) -> bytes:
             return zstd.decompress(data)  # type: ignore[no-any-return]
 
-    ZstdCodec = CompressionCodec("zstd", ZstdCompressor, ZstdDecompressor)
+    ZstdCodec = CompressionCodec("zstd", ZstdCompressor, ZstdDecompressor, zstd.decompress)
     SUPPORTED_COMPRESSIONS["zstd"] = ZstdCodec
 
 except ImportError:
@@ -133,7 +177,7 @@ except ImportError:
             def decompress(self, data: bytes) -> bytes:
                 return pyzstd.decompress(data)
 
-        ZstdCodec = CompressionCodec("zstd", ZstdCompressor, ZstdDecompressor)
+        ZstdCodec = CompressionCodec("zstd", ZstdCompressor, ZstdDecompressor, pyzstd.decompress)
         SUPPORTED_COMPRESSIONS["zstd"] = ZstdCodec
 
     except ImportError:
@@ -141,10 +185,7 @@ except ImportError:
 
 
 def load_compression(id: str) -> CompressionCodec:
-    codec = SUPPORTED_COMPRESSIONS.get(id)
-    if codec is None:
-        codec = IdentityCodec
-    return codec
+    return SUPPORTED_COMPRESSIONS.get(id, IdentityCodec)
 
 
 def supported_compression(id: str) -> bool:
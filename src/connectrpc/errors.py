@@ -5,7 +5,9 @@ error codes, HTTP status mappings, and JSON error parsing.
 """
 
 import base64
+import functools
 import json
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -17,6 +19,43 @@ from google.protobuf.symbol_database import Default as DefaultSymbolDatabase
 from google.protobuf.symbol_database import SymbolDatabase
 from multidict import CIMultiDict
 
+try:
+    # Use orjson when it's installed (connect-python[json]). Its decode
+    # errors subclass json.JSONDecodeError, so callers see the same
+    # exceptions either way.
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson rejects str that isn't valid UTF-8, such as the lone
+            # surrogates left by surrogateescape-decoded bytes in str(exc).
+            # json escapes them instead.
+            return json.dumps(obj)
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+# HTTP/1.1 Status-Lines for the statuses that ConnectErrorCodes map to.
+_HTTP_STATUS_LINES = {
+    400: "400 Bad Request",
+    401: "401 Unauthorized",
+    403: "403 Forbidden",
+    404: "404 Not Found",
+    409: "409 Conflict",
+    429: "429 Too Many Requests",
+    499: "499 Client Closed Request",
+    500: "500 Internal Server Error",
+    501: "501 Not Implemented",
+    503: "503 Service Unavailable",
+    504: "504 Gateway Timeout",
+}
+
 
 class ConnectErrorCode(Enum):
     """Connect Protocol error codes with their HTTP status mappings."""
@@ -41,45 +80,30 @@ class ConnectErrorCode(Enum):
     def __init__(self, code_name: str, http_status: int):
         self.code_name = code_name
         self.http_status = http_status
+        self._status_line = _HTTP_STATUS_LINES[http_status]
 
     @classmethod
     def from_code_name(cls, code_name: str) -> Optional["ConnectErrorCode"]:
         """Get ConnectErrorCode from string code name."""
-        for code in cls:
-            if code.code_name == code_name:
-                return code
-        return None
+        return _CODES_BY_NAME.get(code_name)
 
     @classmethod
     def from_http_status(cls, http_status: int) -> Optional["ConnectErrorCode"]:
         """Get ConnectErrorCode from HTTP status code."""
-        for code in cls:
-            if code.http_status == http_status:
-                return code
-        return None
+        return _CODES_BY_HTTP_STATUS.get(http_status)
 
     def http_status_line(self) -> str:
         """
         Returns the HTTP/1.1 Status-Line for a response containing this error.
         """
-        return {
-            self.CANCELED: "499 Client Closed Request",
-            self.UNKNOWN: "500 Internal Server Error",
-            self.INVALID_ARGUMENT: "400 Bad Request",
-            self.DEADLINE_EXCEEDED: "504 Gateway Timeout",
-            self.NOT_FOUND: "404 Not Found",
-            self.ALREADY_EXISTS: "409 Conflict",
-            self.PERMISSION_DENIED: "403 Forbidden",
-            self.RESOURCE_EXHAUSTED: "429 Too Many Requests",
-            self.FAILED_PRECONDITION: "400 Bad Request",
-            self.ABORTED: "409 Conflict",
-            self.OUT_OF_RANGE: "400 Bad Request",
-            self.UNIMPLEMENTED: "501 Not Implemented",
-            self.INTERNAL: "500 Internal Server Error",
-            self.UNAVAILABLE: "503 Service Unavailable",
-            self.DATA_LOSS: "500 Internal Server Error",
-            self.UNAUTHENTICATED: "401 Unauthorized",
-        }[self]  # type:ignore[index]
+        return self._status_line
+
+
+# Lookup tables for ConnectErrorCode.from_code_name and from_http_status.
+# Several codes share an HTTP status; the first one declared wins, so
+# build that table in reverse.
+_CODES_BY_NAME = {code.code_name: code for code in ConnectErrorCode}
+_CODES_BY_HTTP_STATUS = {code.http_status: code for code in reversed(ConnectErrorCode)}
 
 
 # HTTP status to Connect error code fallback mapping
@@ -99,12 +123,9 @@ HTTP_TO_CONNECT_FALLBACK = {
 def infer_connect_code_from_http_status(http_status: int) -> ConnectErrorCode:
     """Infer Connect error code from HTTP status when no explicit code is provided."""
     # Use the inference mapping table (not direct ConnectErrorCode mapping)
-    # This follows the Connect spec's HTTP-to-Connect error code mapping
-    if http_status in HTTP_TO_CONNECT_FALLBACK:
-        return HTTP_TO_CONNECT_FALLBACK[http_status]
-
-    # Default to unknown for all other status codes
-    return ConnectErrorCode.UNKNOWN
+    # This follows the Connect spec's HTTP-to-Connect error code mapping.
+    # Default to unknown for all other status codes.
+    return HTTP_TO_CONNECT_FALLBACK.get(http_status, ConnectErrorCode.UNKNOWN)
 
 
 @dataclass
@@ -157,8 +178,9 @@ class ConnectErrorDetail:
 
         """
         if symbol_db is None:
-            symbol_db = DefaultSymbolDatabase()
-        msg_type = symbol_db.GetSymbol(self.type)
+            msg_type = _default_symbol(self.type)
+        else:
+            msg_type = symbol_db.GetSymbol(self.type)
         msg_val = msg_type()
 
         # Add '==' to ensure the value is padded
@@ -168,6 +190,13 @@ class ConnectErrorDetail:
         return msg_val
 
 
+@functools.lru_cache(maxsize=128)
+def _default_symbol(name: str) -> type[Message]:
+    # Errors tend to carry the same few detail types, so remember where
+    # they were found. Failed lookups raise, and so aren't cached.
+    return DefaultSymbolDatabase().GetSymbol(name)
+
+
 class BareHTTPError(Exception):
     """Represents an HTTP-level error response.
 
@@ -220,15 +249,22 @@ class ConnectError(Exception):
 
     def to_json(self) -> str:
         """Serialize error to JSON format per Connect specification."""
+        if not self.details:
+            # The common case. Code names are plain ASCII identifiers, so
+            # only the message needs encoding.
+            return (
+                f'{{"code":"{self.code.code_name}",'
+                f'"message":{_json_dumps(self.message)},"details":[]}}'
+            )
         error_dict = self.to_dict()
-        return json.dumps(error_dict)
+        return _json_dumps(error_dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary representation."""
         result: dict[str, Any] = {
             "code": self.code.code_name,
             "message": self.message,
-            "details": [d.to_dict() for d in self.details],
+            "details": list(map(ConnectErrorDetail.to_dict, self.details)),
         }
         return result
 
@@ -246,11 +282,11 @@ class ConnectError(Exception):
         self.details.append(detail)
 
     @classmethod
-    def from_json(cls, json_str: str, http_status: int | None = None) -> "ConnectError":
+    def from_json(cls, json_str: str | bytes, http_status: int | None = None) -> "ConnectError":
         """Parse ConnectError from JSON response.
 
         Args:
-            json_str: JSON error response
+            json_str: JSON error response, as text or UTF-8 encoded bytes
             http_status: HTTP status code from response
 
         Returns:
@@ -260,7 +296,7 @@ class ConnectError(Exception):
             ValueError: If JSON is malformed or missing required fields
         """
         try:
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in error response: {e}") from e
 
@@ -295,8 +331,8 @@ class ConnectError(Exception):
             code = infer_connect_code_from_http_status(http_status or 500)
 
         # Extract additional details (everything except code/message)
-        details = data.get("details", [])
-        details = [ConnectErrorDetail.from_dict(d) for d in details]
+        detail_from_dict = ConnectErrorDetail.from_dict
+        details = [detail_from_dict(d) for d in data.get("details", [])]
 
         return cls(code, message, details, http_status)
 
@@ -318,6 +354,16 @@ class ConnectError(Exception):
             code = infer_connect_code_from_http_status(http_status)
             return cls(code, f"HTTP {http_status}", http_status=http_status)
 
+        # Try to parse as JSON error. The JSON parsers take bytes, so
+        # there's no need to decode the body first.
+        if content.strip():
+            try:
+                return cls.from_json(content, http_status)
+            except (ValueError, json.JSONDecodeError):
+                # Malformed JSON (or invalid UTF-8, which is also a
+                # ValueError), fall back to HTTP status inference
+                pass
+
         # Normalize content to string
         if isinstance(content, bytes):
             try:
@@ -328,14 +374,6 @@ class ConnectError(Exception):
                     code, f"HTTP {http_status}: Invalid UTF-8 content", http_status=http_status
                 )
 
-        # Try to parse as JSON error
-        if content.strip():
-            try:
-                return cls.from_json(content, http_status)
-            except (ValueError, json.JSONDecodeError):
-                # Malformed JSON, fall back to HTTP status inference
-                pass
-
         # Fall back to HTTP status code inference
         code = infer_connect_code_from_http_status(http_status)
         message = f"HTTP {http_status}" + (f": {content}" if content else "")
@@ -16,18 +16,74 @@ common_args = [
 common_args_str = ", ".join(common_args)
 
 
-def rpc_url_str(f: protogen.File, s: protogen.Service, m: protogen.Method) -> str:
-    route = f"{s.proto.name}/{m.proto.name}"
+def service_path(f: protogen.File, s: protogen.Service) -> str:
+    """Returns the path that a service's RPC URLs start with:
+    /package.Service, or /Service outside of a package.
+    """
     if f.proto.package != "":
-        route = f.proto.package + "." + route
-    return f'"/{route}"'
+        return f"/{f.proto.package}.{s.proto.name}"
+    return f"/{s.proto.name}"
+
+
+def rpc_url_str(path: str, m: protogen.Method) -> str:
+    """Returns a string literal for a method's URL path, given its
+    service's path.
+    """
+    return f'"{path}/{m.proto.name}"'
+
+
+def rpc_url_attr(m: protogen.Method) -> str:
+    return "self._url_" + m.py_name
+
+
+def generate_url_attrs(g: protogen.GeneratedFile, f: protogen.File, s: protogen.Service) -> None:
+    # RPC URLs are fixed for the life of the client, so build them once
+    # rather than on every call.
+    path = service_path(f, s)
+    for m in s.methods:
+        g.P("    ", rpc_url_attr(m), " = base_url + ", rpc_url_str(path, m))
+
+
+def generate_slots(g: protogen.GeneratedFile, s: protogen.Service) -> None:
+    slots = ["base_url", "_connect_client"] + ["_url_" + m.py_name for m in s.methods]
+    g.P("__slots__ = (", ", ".join(f'"{slot}"' for slot in slots), ")")
+
+
+def generate_unwrap_helpers(g: protogen.GeneratedFile) -> None:
+    # Shared by every generated client method, so that the error checks
+    # live at a single call site rather than being repeated per RPC.
+    g.P('_T = typing.TypeVar("_T", bound=Message)')
+    g.P()
+    g.P()
+    g.P("def _unwrap_unary(response: UnaryOutput[_T]) -> _T:")
+    g.P("    err = response.error()")
+    g.P("    if err is not None:")
+    g.P("        raise err")
+    g.P("    msg = response.message()")
+    g.P("    if msg is None:")
+    g.P("        raise ConnectProtocolError('missing response message')")
+    g.P("    return msg")
+    g.P()
+    g.P()
+    # Streaming methods return this generator directly, so that each
+    # message passes through a single generator frame. It takes the call
+    # rather than its output so that, as before, the request is only sent
+    # once iteration starts.
+    g.P("def _unwrap_stream(call: Callable[[], StreamOutput[_T]]) -> Iterator[_T]:")
+    g.P("    stream_output = call()")
+    g.P("    err = stream_output.error()")
+    g.P("    if err is not None:")
+    g.P("        raise err")
+    g.P("    yield from stream_output")
+    g.P("    err = stream_output.error()")
+    g.P("    if err is not None:")
+    g.P("        raise err")
+    g.P()
+    g.P()
 
 
 def service_url_prefix(f: protogen.File, s: protogen.Service) -> str:
-    route = s.proto.name
-    if f.proto.package != "":
-        route = f.proto.package + "." + route
-    return f'"/{route}"'
+    return f'"{service_path(f, s)}"'
 
 
 def generate(gen: protogen.Plugin) -> None:
@@ -44,6 +100,7 @@ def generate(gen: protogen.Plugin) -> None:
         g.P()
         g.P("from __future__ import annotations")
         g.P("from collections.abc import AsyncIterator")
+        g.P("from collections.abc import Callable")
         g.P("from collections.abc import Iterator")
         g.P("from collections.abc import Iterable")
         g.P("import aiohttp")
@@ -51,6 +108,7 @@ def generate(gen: protogen.Plugin) -> None:
         g.P("import typing")
         g.P("import sys")
         g.P()
+        g.P("from google.protobuf.message import Message")
         g.P("from connectrpc.client_async import AsyncConnectClient")
         g.P("from connectrpc.client_sync import ConnectClient")
         g.P("from connectrpc.client_protocol import ConnectProtocol")
@@ -76,6 +134,7 @@ def generate(gen: protogen.Plugin) -> None:
         g.P()
         g.print_import()
         g.P()
+        generate_unwrap_helpers(g)
 
         for s in f.services:
             SyncClientGenerator(g, f, s).generate()
@@ -102,23 +161,24 @@ class SyncClientGenerator:
 
     def generate(self) -> None:
         self.generate_init()
+        # Keyed by (client_streaming, server_streaming).
+        generators = {
+            (False, False): self.generate_unary_rpc,
+            (False, True): self.generate_server_streaming_rpc,
+            (True, False): self.generate_client_streaming_rpc,
+            (True, True): self.generate_bidirectional_streaming_rpc,
+        }
         for m in self.s.methods:
             assert m.input is not None, f"Method {m.py_name} input should be resolved"
             assert m.output is not None, f"Method {m.py_name} output should be resolved"
-
-            if not m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_unary_rpc(m)
-            elif not m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_server_streaming_rpc(m)
-            elif m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_client_streaming_rpc(m)
-            elif m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_bidirectional_streaming_rpc(m)
+            generators[(m.proto.client_streaming, m.proto.server_streaming)](m)
 
     def generate_init(self) -> None:
         self.g.set_indent(0)
         self.g.P("class ", protogen.PyIdent(import_path(self.f), self.s.proto.name), "Client:")
         self.g.set_indent(4)
+        generate_slots(self.g, self.s)
+        self.g.P()
         self.g.P("def __init__(")
         self.g.P("    self,")
         self.g.P("    base_url: str,")
@@ -127,6 +187,7 @@ class SyncClientGenerator:
         self.g.P("):")
         self.g.P("    self.base_url = base_url")
         self.g.P("    self._connect_client = ConnectClient(http_client, protocol)")
+        generate_url_attrs(self.g, self.f, self.s)
 
     def generate_unary_rpc(self, m: protogen.Method) -> None:
         self.g.P("def call_", m.py_name, "(")
@@ -139,7 +200,7 @@ class SyncClientGenerator:
             m.proto.name,
             ", granting access to errors and metadata",
         )
-        self.g.P("url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("url = ", rpc_url_attr(m))
         self.g.P(
             "return self._connect_client.call_unary(url, req, ",
             m.output.py_ident,
@@ -154,14 +215,7 @@ class SyncClientGenerator:
         self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
         self.g.P(") -> ", m.output.py_ident, ":")
         self.g.set_indent(8)
-        self.g.P("response = self.call_", m.py_name, "(req, ", common_args_str, ")")
-        self.g.P("err = response.error()")
-        self.g.P("if err is not None:")
-        self.g.P("    raise err")
-        self.g.P("msg = response.message()")
-        self.g.P("if msg is None:")
-        self.g.P("    raise ConnectProtocolError('missing response message')")
-        self.g.P("return msg")
+        self.g.P("return _unwrap_unary(self.call_", m.py_name, "(req, ", common_args_str, "))")
         self.g.set_indent(4)
         self.g.P()
 
@@ -169,21 +223,13 @@ class SyncClientGenerator:
         self.g.P("def ", m.py_name, "(")
         self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
         self.g.P(") -> Iterator[", m.output.py_ident, "]:")
-        self.g.P("    return self._", m.py_name, "_iterator(req, ", common_args_str, ")")
-        self.g.P()
-
-        self.g.P("def _", m.py_name, "_iterator(")
-        self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
-        self.g.P(") -> Iterator[", m.output.py_ident, "]:")
-        self.g.P("    stream_output = self.call_", m.py_name, "(req, extra_headers)")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-        self.g.P("    yield from stream_output")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-
+        self.g.P(
+            "    return _unwrap_stream(lambda: self.call_",
+            m.py_name,
+            "(req, ",
+            common_args_str,
+            "))",
+        )
         self.g.P()
 
         self.g.P("def call_", m.py_name, "(")
@@ -197,7 +243,7 @@ class SyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P("    url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return self._connect_client.call_server_streaming(")
         self.g.P("        url, req, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
@@ -215,7 +261,7 @@ class SyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P("    url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return self._connect_client.call_client_streaming(")
         self.g.P("        url, reqs, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
@@ -239,22 +285,13 @@ class SyncClientGenerator:
         self.g.P("def ", m.py_name, "(")
         self.g.P("    self, reqs: Iterable[", m.input.py_ident, "], ", common_params_str)
         self.g.P(") -> Iterator[", m.output.py_ident, "]:")
-        self.g.P("    return self._", m.py_name, "_iterator(reqs, ", common_args_str, ")")
-        self.g.P()
-
-        # Implementation helper
-        self.g.P("def _", m.py_name, "_iterator(")
-        self.g.P("    self, reqs: Iterable[", m.input.py_ident, "], ", common_params_str)
-        self.g.P(") -> Iterator[", m.output.py_ident, "]:")
-        self.g.P("    stream_output = self.call_", m.py_name, "(reqs, ", common_args_str, ")")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-        self.g.P("    yield from stream_output")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-
+        self.g.P(
+            "    return _unwrap_stream(lambda: self.call_",
+            m.py_name,
+            "(reqs, ",
+            common_args_str,
+            "))",
+        )
         self.g.P()
 
         # Stream method for metadata access
@@ -274,7 +311,7 @@ class SyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P("    url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return self._connect_client.call_bidirectional_streaming(")
         self.g.P("        url, reqs, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
@@ -294,6 +331,8 @@ class AsyncClientGenerator:
         self.g.set_indent(0)
         self.g.P("class Async", protogen.PyIdent(import_path(self.f), self.s.proto.name), "Client:")
         self.g.set_indent(4)
+        generate_slots(self.g, self.s)
+        self.g.P()
         self.g.P("def __init__(")
         self.g.P("    self,")
         self.g.P("    base_url: str,")
@@ -302,23 +341,23 @@ class AsyncClientGenerator:
         self.g.P("):")
         self.g.P("    self.base_url = base_url")
         self.g.P("    self._connect_client = AsyncConnectClient(http_client, protocol)")
+        generate_url_attrs(self.g, self.f, self.s)
         self.g.P()
 
     def generate(self) -> None:
         self.generate_init()
 
+        # Keyed by (client_streaming, server_streaming).
+        generators = {
+            (False, False): self.generate_unary_rpc,
+            (False, True): self.generate_server_streaming_rpc,
+            (True, False): self.generate_client_streaming_rpc,
+            (True, True): self.generate_bidirectional_streaming_rpc,
+        }
         for m in self.s.methods:
             assert m.input is not None, f"Method {m.py_name} input should be resolved"
             assert m.output is not None, f"Method {m.py_name} output should be resolved"
-
-            if not m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_unary_rpc(m)
-            elif not m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_server_streaming_rpc(m)
-            elif m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_client_streaming_rpc(m)
-            elif m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_bidirectional_streaming_rpc(m)
+            generators[(m.proto.client_streaming, m.proto.server_streaming)](m)
 
     def generate_unary_rpc(self, m: protogen.Method) -> None:
         """Generate a unary RPC method."""
@@ -332,7 +371,7 @@ class AsyncClientGenerator:
             m.proto.name,
             ", granting access to errors and metadata",
         )
-        self.g.P("url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("url = ", rpc_url_attr(m))
         self.g.P(
             "return await self._connect_client.call_unary(url, req, ",
             m.output.py_ident,
@@ -346,34 +385,22 @@ class AsyncClientGenerator:
         self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
         self.g.P(") -> ", m.output.py_ident, ":")
         self.g.set_indent(8)
-        self.g.P("response = await self.call_", m.py_name, "(req, ", common_args_str, ")")
-        self.g.P("err = response.error()")
-        self.g.P("if err is not None:")
-        self.g.P("    raise err")
-        self.g.P("msg = response.message()")
-        self.g.P("if msg is None:")
-        self.g.P("    raise ConnectProtocolError('missing response message')")
-        self.g.P("return msg")
+        self.g.P(
+            "return _unwrap_unary(await self.call_", m.py_name, "(req, ", common_args_str, "))"
+        )
         self.g.set_indent(4)
         self.g.P()
 
     def generate_server_streaming_rpc(self, m: protogen.Method) -> None:
-        # Simple iterator method
-        self.g.P("def ", m.py_name, "(")
-        self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
-        self.g.P(") -> AsyncIterator[", m.output.py_ident, "]:")
-        self.g.P("    return self._", m.py_name, "_iterator(req, ", common_args_str, ")")
-        self.g.P()
-
-        # Implementation helper
-        self.g.P("async def _", m.py_name, "_iterator(")
+        # Simple iterator method. Errors which abort the stream before
+        # any messages arrive are also reported through stream.error(),
+        # so a single check after iteration covers both cases.
+        self.g.P("async def ", m.py_name, "(")
         self.g.P("    self, req: ", m.input.py_ident, ",", common_params_str)
         self.g.P(") -> AsyncIterator[", m.output.py_ident, "]:")
-        self.g.P("    stream_output = await self.call_", m.py_name, "(req, extra_headers)")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-        self.g.P("    async with stream_output as stream:")
+        self.g.P(
+            "    async with await self.call_", m.py_name, "(req, ", common_args_str, ") as stream:"
+        )
         self.g.P("        async for response in stream:")
         self.g.P("            yield response")
         self.g.P("        err = stream.error()")
@@ -392,7 +419,7 @@ class AsyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P("    url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return await self._connect_client.call_server_streaming(")
         self.g.P("        url, req, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
@@ -411,15 +438,7 @@ class AsyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P(
-            '    url = self.base_url + "/',
-            self.f.proto.package,
-            ".",
-            self.s.proto.name,
-            "/",
-            m.proto.name,
-            '"',
-        )
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return await self._connect_client.call_client_streaming(")
         self.g.P("        url, reqs, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
@@ -440,27 +459,17 @@ class AsyncClientGenerator:
 
     def generate_bidirectional_streaming_rpc(self, m: protogen.Method) -> None:
         # Simple iterator method
-        self.g.P("def ", m.py_name, "(")
-        self.g.P("    self, reqs: StreamInput[", m.input.py_ident, "], ", common_params_str)
-        self.g.P(") -> AsyncIterator[", m.output.py_ident, "]:")
-        self.g.P("    return self._", m.py_name, "_iterator(reqs, ", common_args_str, ")")
-        self.g.P()
-
-        # Implementation helper
-        self.g.P("async def _", m.py_name, "_iterator(")
+        self.g.P("async def ", m.py_name, "(")
         self.g.P("    self, reqs: StreamInput[", m.input.py_ident, "], ", common_params_str)
         self.g.P(") -> AsyncIterator[", m.output.py_ident, "]:")
-        self.g.P("    stream_output = await self.call_", m.py_name, "(reqs, ", common_args_str, ")")
-        self.g.P("    err = stream_output.error()")
-        self.g.P("    if err is not None:")
-        self.g.P("        raise err")
-        self.g.P("    async with stream_output as stream:")
+        self.g.P(
+            "    async with await self.call_", m.py_name, "(reqs, ", common_args_str, ") as stream:"
+        )
         self.g.P("        async for response in stream:")
         self.g.P("            yield response")
         self.g.P("        err = stream.error()")
         self.g.P("        if err is not None:")
         self.g.P("            raise err")
-
         self.g.P()
 
         # Stream method for metadata access
@@ -480,13 +489,22 @@ class AsyncClientGenerator:
             ", granting access to errors and metadata",
         )
         self.g.set_indent(4)
-        self.g.P("    url = self.base_url + ", rpc_url_str(self.f, self.s, m))
+        self.g.P("    url = ", rpc_url_attr(m))
         self.g.P("    return await self._connect_client.call_bidirectional_streaming(")
         self.g.P("        url, reqs, ", m.output.py_ident, ", ", common_args_str)
         self.g.P("    )")
         self.g.P()
 
 
+# ConnectWSGI registration methods, keyed by (client_streaming, server_streaming).
+_WSGI_REGISTER_METHODS = {
+    (False, False): "register_unary_rpc",
+    (False, True): "register_server_streaming_rpc",
+    (True, False): "register_client_streaming_rpc",
+    (True, True): "register_bidi_streaming_rpc",
+}
+
+
 class WSGIServerGenerator:
     def __init__(self, g: protogen.GeneratedFile, f: protogen.File, s: protogen.Service):
         self.g = g
@@ -516,34 +534,17 @@ class WSGIServerGenerator:
             ") -> WSGIApplication:",
         )
         self.g.P("    app = ConnectWSGI()")
+        path = service_path(self.f, self.s)
         for m in self.s.methods:
             assert m.input is not None, f"Method {m.py_name} input should be resolved"
             assert m.output is not None, f"Method {m.py_name} output should be resolved"
-
-            if not m.proto.client_streaming and not m.proto.server_streaming:
-                self.g.P(
-                    f"    app.register_unary_rpc({rpc_url_str(self.f, self.s, m)}, implementation.{m.py_name}, ",
-                    m.input.py_ident,
-                    ")",
-                )
-            elif not m.proto.client_streaming and m.proto.server_streaming:
-                self.g.P(
-                    f"    app.register_server_streaming_rpc({rpc_url_str(self.f, self.s, m)}, implementation.{m.py_name}, ",
-                    m.input.py_ident,
-                    ")",
-                )
-            elif m.proto.client_streaming and not m.proto.server_streaming:
-                self.g.P(
-                    f"    app.register_client_streaming_rpc({rpc_url_str(self.f, self.s, m)}, implementation.{m.py_name}, ",
-                    m.input.py_ident,
-                    ")",
-                )
-            elif m.proto.client_streaming and m.proto.server_streaming:
-                self.g.P(
-                    f"    app.register_bidi_streaming_rpc({rpc_url_str(self.f, self.s, m)}, implementation.{m.py_name}, ",
-                    m.input.py_ident,
-                    ")",
-                )
+            url = rpc_url_str(path, m)
+            register = _WSGI_REGISTER_METHODS[(m.proto.client_streaming, m.proto.server_streaming)]
+            self.g.P(
+                f"    app.{register}({url}, implementation.{m.py_name}, ",
+                m.input.py_ident,
+                ")",
+            )
 
         self.g.P("    return app")
 
@@ -562,18 +563,17 @@ class WSGIServerGenerator:
     def generate_protocol(self) -> None:
         self.g.P("@typing.runtime_checkable")
         self.g.P("class ", self.protocol_name(), "(typing.Protocol):")
+        # Keyed by (client_streaming, server_streaming).
+        generators = {
+            (False, False): self.generate_unary_protocol,
+            (False, True): self.generate_server_streaming_protocol,
+            (True, False): self.generate_client_streaming_protocol,
+            (True, True): self.generate_bidirectional_streaming_protocol,
+        }
         for m in self.s.methods:
             assert m.input is not None, f"Method {m.py_name} input should be resolved"
             assert m.output is not None, f"Method {m.py_name} output should be resolved"
-
-            if not m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_unary_protocol(m)
-            elif not m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_server_streaming_protocol(m)
-            elif m.proto.client_streaming and not m.proto.server_streaming:
-                self.generate_client_streaming_protocol(m)
-            elif m.proto.client_streaming and m.proto.server_streaming:
-                self.generate_bidirectional_streaming_protocol(m)
+            generators[(m.proto.client_streaming, m.proto.server_streaming)](m)
 
     def generate_unary_protocol(self, m: protogen.Method) -> None:
         self.g.P(
@@ -1,6 +1,22 @@
 from typing import Protocol
 
 from .connect_compression import Decompressor
+from .streams_connect import ENVELOPE
+
+# Slicing a bytearray copies, and so does turning the slice into bytes.
+# Going through a memoryview skips the first copy, which pays for the
+# view's own setup once frames are larger than this.
+_MEMORYVIEW_COPY_MIN = 16384
+
+
+def copy_frame(buf: bytearray, start: int, end: int) -> bytes:
+    """Returns buf[start:end] as bytes, copying it as few times as is
+    worthwhile.
+    """
+    if end - start < _MEMORYVIEW_COPY_MIN:
+        return bytes(buf[start:end])
+    with memoryview(buf) as view:
+        return bytes(view[start:end])
 
 
 class Stream(Protocol):
@@ -52,6 +68,29 @@ class StreamReader:
         del self.buffer[:n]
         return chunk
 
+    def read_frame(self) -> tuple[int, bytes] | None:
+        """Read one enveloped message from a Connect stream, returning
+        its flags and (still encoded) contents.
+
+        Returns None if the stream ends before a complete envelope
+        header, and raises EOFError if it ends partway through the
+        message. This works directly on the buffer, so that each frame
+        is copied out of it once (see copy_frame).
+
+        """
+        buf = self.buffer
+        while len(buf) < ENVELOPE.size:
+            if not self.fill_buffer():
+                return None
+        flags, length = ENVELOPE.unpack_from(buf)
+        end = ENVELOPE.size + length
+        while len(buf) < end:
+            if not self.fill_buffer():
+                raise EOFError
+        data = copy_frame(buf, ENVELOPE.size, end)
+        del buf[:end]
+        return flags, data
+
     def readall(self) -> bytearray:
         data = self._src_read(-1)
         if len(data) > 0 and self.decom is not None:
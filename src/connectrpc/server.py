@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import struct
 from collections.abc import Iterable
 from collections.abc import Iterator
 from typing import Generic
@@ -9,6 +8,9 @@ from typing import TypeVar
 from google.protobuf.message import Message
 from multidict import CIMultiDict
 
+from connectrpc.streams_connect import ENVELOPE
+from connectrpc.streams_connect import FLAG_COMPRESSED
+from connectrpc.streams_connect import FLAG_END_STREAM
 from connectrpc.streams_connect import EndStreamResponse
 
 from .connect_serialization import ConnectSerialization
@@ -78,30 +80,29 @@ class ClientStream(Generic[T]):
 
     @classmethod
     def from_client_req(cls, req: ConnectStreamingRequest, msg_type: type[T]) -> ClientStream[T]:
+        parse = req.serialization.parser(msg_type)
+        compression = req.compression
+
         def message_iterator() -> Iterator[T]:
             while True:
-                try:
-                    envelope = req.body.readexactly(5)
-                except EOFError:
+                frame = req.body.read_frame()
+                if frame is None:
                     return
-                envelope_flags, msg_length = struct.unpack(">BI", envelope)
-                data: bytes | bytearray = req.body.readexactly(msg_length)
+                envelope_flags, data = frame
 
-                if envelope_flags & 1:
+                # Uncompressed messages are fine even when compression was
+                # specified; some implementations only compress some
+                # messages.
+                if envelope_flags & FLAG_COMPRESSED:
                     # Message is compressed - check if compression is expected
-                    if req.compression.label == "identity":
+                    if compression.is_identity:
                         raise ConnectError(
                             ConnectErrorCode.INTERNAL,
                             "received compressed message but no compression was specified in headers",
                         )
-                    decompressor = req.compression.decompressor()
-                    data = decompressor.decompress(bytes(data))
-                elif req.compression.label != "identity":
-                    # No compression flag but compression was specified - this might be OK
-                    # Some implementations send uncompressed messages even when compression is available
-                    pass
-
-                msg = req.serialization.deserialize(bytes(data), msg_type)
+                    data = compression.decompress(data)
+
+                msg = parse(data)
                 req.timeout.check()
                 yield msg
 
@@ -137,14 +138,14 @@ class ServerStream(Generic[T]):
 
         """
         end_msg = EndStreamResponse(None, self.trailers)
+        serialize = ser.serializer()
+        pack = ENVELOPE.pack
         for msg in self.msgs:
             if isinstance(msg, ConnectError):
                 end_msg.error = msg
                 break
-            data = ser.serialize(msg)
-            envelope = struct.pack(">BI", 0, len(data))
-            yield envelope + data
+            data = serialize(msg)
+            yield pack(0, len(data)) + data
 
         data = end_msg.to_json()
-        envelope = struct.pack(">BI", 2, len(data))
-        yield envelope + data
+        yield ENVELOPE.pack(FLAG_END_STREAM, len(data)) + data
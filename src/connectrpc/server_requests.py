@@ -263,8 +263,8 @@ class ConnectStreamingRequest(ConnectRequest):
         """Handle ConnectError for streaming requests."""
         # Per Connect spec: streaming responses always have HTTP 200 OK
         # Errors are sent as EndStreamResponse with envelope flag 2
-        import struct
-
+        from connectrpc.streams_connect import ENVELOPE
+        from connectrpc.streams_connect import FLAG_END_STREAM
         from connectrpc.streams_connect import EndStreamResponse
 
         resp.set_status_line("200 OK")
@@ -279,5 +279,5 @@ class ConnectStreamingRequest(ConnectRequest):
         # Send error as EndStreamResponse
         end_stream_response = EndStreamResponse(error, CIMultiDict())
         data = end_stream_response.to_json()
-        envelope = struct.pack(">BI", 2, len(data))  # Flag 2 = EndStreamResponse
+        envelope = ENVELOPE.pack(FLAG_END_STREAM, len(data))
         resp.set_body([envelope + data])
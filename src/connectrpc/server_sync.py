@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import struct
 import sys
 from collections.abc import Callable
 from collections.abc import Iterable
@@ -24,6 +23,8 @@ from connectrpc.server_requests import ConnectUnaryRequest
 from connectrpc.server_rpc_types import RPCType
 from connectrpc.server_wsgi import WSGIRequest
 from connectrpc.server_wsgi import WSGIResponse
+from connectrpc.streams_connect import ENVELOPE
+from connectrpc.streams_connect import FLAG_END_STREAM
 from connectrpc.streams_connect import EndStreamResponse
 
 if TYPE_CHECKING:
@@ -110,7 +111,7 @@ class ConnectWSGI:
         # Send error as EndStreamResponse
         end_stream_response = EndStreamResponse(error, CIMultiDict())
         data = end_stream_response.to_json()
-        envelope = struct.pack(">BI", 2, len(data))  # Flag 2 = EndStreamResponse
+        envelope = ENVELOPE.pack(FLAG_END_STREAM, len(data))
         resp.set_body([envelope + data])
 
     def __call__(self, environ: WSGIEnvironment, start_response: StartResponse) -> Iterable[bytes]:
@@ -188,7 +189,9 @@ class ConnectWSGI:
 
         trailers: CIMultiDict[str] = CIMultiDict()
         for k, v in connect_req.headers.items():
-            if k.startswith("trailer-"):
+            # WSGI hands over header names upper-cased (HTTP_TRAILER_X
+            # becomes TRAILER-X), so compare the prefix case-insensitively.
+            if k[:8].lower() == "trailer-":
                 trailers.add(k, v)
 
         client_req = ClientRequest(msg, connect_req.headers, trailers, connect_req.timeout)
@@ -54,6 +54,8 @@ class AsyncStreamOutput(Protocol[U]):
 
     """
 
+    __slots__ = ()
+
     def __aiter__(self) -> AsyncIterator[U]:
         """Return async iterator for the stream messages."""
         ...
@@ -115,6 +117,8 @@ class AsyncStreamOutput(Protocol[U]):
 
 
 class StreamOutput(Protocol[U]):
+    __slots__ = ()
+
     def response_headers(self) -> CIMultiDict[str]: ...
 
     def response_trailers(self) -> CIMultiDict[str]: ...
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import struct
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 from typing import TypeVar
 
 from google.protobuf.message import Message
@@ -12,6 +15,24 @@ from connectrpc.errors import ConnectErrorCode
 
 T = TypeVar("T", bound=Message)
 
+try:
+    # Use orjson when it's installed (connect-python[json]); its errors
+    # subclass json.JSONDecodeError, so callers see the same exceptions.
+    import orjson
+
+    _json_loads: Callable[[bytes | bytearray], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Each message in a Connect stream is prefixed with an envelope: one
+# byte of flags and the message length as a big-endian uint32. Compile
+# the format once instead of reparsing it for every frame.
+ENVELOPE = struct.Struct(">BI")
+
+# Envelope flags.
+FLAG_COMPRESSED = 1
+FLAG_END_STREAM = 2
+
 
 @dataclass
 class EndStreamResponse:
@@ -38,7 +59,7 @@ class EndStreamResponse:
 
     @classmethod
     def from_bytes(cls, data: bytes | bytearray) -> EndStreamResponse:
-        data_dict = json.loads(data)
+        data_dict = _json_loads(data)
 
         val = EndStreamResponse(error=None, metadata=CIMultiDict())
         if "error" in data_dict and data_dict["error"] is not None:
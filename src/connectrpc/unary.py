@@ -15,6 +15,8 @@ T = TypeVar("T", bound=Message, covariant=True)
 
 
 class UnaryOutput(Protocol[T]):
+    __slots__ = ()
+
     def message(self) -> T | None: ...
 
     def response_headers(self) -> CIMultiDict[str]: ...
@@ -47,22 +49,24 @@ class ClientStreamingOutput(UnaryOutput[T]):
     def from_stream_output(cls, stream_output: StreamOutput[T]) -> ClientStreamingOutput[T]:
         response: T | None = None
         error: ConnectError | None = None
-        for msg in stream_output:
-            if response is not None:
-                # The server should only give us exactly one
-                # response. If we got multiple, we should abort;
-                # ignore trailers encoded in the stream.
-                empty_trailers: CIMultiDict[str] = CIMultiDict()
-                return cls(
-                    message=None,
-                    headers=stream_output.response_headers(),
-                    trailers=empty_trailers,
-                    error=ConnectError(
-                        ConnectErrorCode.UNIMPLEMENTED,
-                        "server responded with multiple messages; expecting exactly one",
-                    ),
-                )
-            response = msg
+
+        with stream_output as stream:
+            for msg in stream:
+                if response is not None:
+                    # The server should only give us exactly one
+                    # response. If we got multiple, we should abort;
+                    # ignore trailers encoded in the stream.
+                    empty_trailers: CIMultiDict[str] = CIMultiDict()
+                    return cls(
+                        message=None,
+                        headers=stream_output.response_headers(),
+                        trailers=empty_trailers,
+                        error=ConnectError(
+                            ConnectErrorCode.UNIMPLEMENTED,
+                            "server responded with multiple messages; expecting exactly one",
+                        ),
+                    )
+                response = msg
 
         if response is None:
             error = stream_output.error()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from collections.abc import AsyncIterator
+from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Iterable
 import aiohttp
@@ -9,6 +10,7 @@ import urllib3
 import typing
 import sys
 
+from google.protobuf.message import Message
 from connectrpc.client_async import AsyncConnectClient
 from connectrpc.client_sync import ConnectClient
 from connectrpc.client_protocol import ConnectProtocol
@@ -34,7 +36,33 @@ if typing.TYPE_CHECKING:
 
 import connectrpc.conformance.v1.service_pb2
 
+_T = typing.TypeVar("_T", bound=Message)
+
+
+def _unwrap_unary(response: UnaryOutput[_T]) -> _T:
+    err = response.error()
+    if err is not None:
+        raise err
+    msg = response.message()
+    if msg is None:
+        raise ConnectProtocolError('missing response message')
+    return msg
+
+
+def _unwrap_stream(call: Callable[[], StreamOutput[_T]]) -> Iterator[_T]:
+    stream_output = call()
+    err = stream_output.error()
+    if err is not None:
+        raise err
+    yield from stream_output
+    err = stream_output.error()
+    if err is not None:
+        raise err
+
+
 class ConformanceServiceClient:
+    __slots__ = ("base_url", "_connect_client", "_url_unary", "_url_server_stream", "_url_client_stream", "_url_bidi_stream", "_url_unimplemented", "_url_idempotent_unary")
+
     def __init__(
         self,
         base_url: str,
@@ -43,48 +71,35 @@ class ConformanceServiceClient:
     ):
         self.base_url = base_url
         self._connect_client = ConnectClient(http_client, protocol)
+        self._url_unary = base_url + "/connectrpc.conformance.v1.ConformanceService/Unary"
+        self._url_server_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/ServerStream"
+        self._url_client_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/ClientStream"
+        self._url_bidi_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/BidiStream"
+        self._url_unimplemented = base_url + "/connectrpc.conformance.v1.ConformanceService/Unimplemented"
+        self._url_idempotent_unary = base_url + "/connectrpc.conformance.v1.ConformanceService/IdempotentUnary"
     def call_unary(
         self, req: connectrpc.conformance.v1.service_pb2.UnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.UnaryResponse]:
         """Low-level method to call Unary, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/Unary"
+        url = self._url_unary
         return self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.UnaryResponse,extra_headers, timeout_seconds)
 
 
     def unary(
         self, req: connectrpc.conformance.v1.service_pb2.UnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.UnaryResponse:
-        response = self.call_unary(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(self.call_unary(req, extra_headers, timeout_seconds))
 
     def server_stream(
         self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> Iterator[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
-        return self._server_stream_iterator(req, extra_headers, timeout_seconds)
-
-    def _server_stream_iterator(
-        self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> Iterator[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
-        stream_output = self.call_server_stream(req, extra_headers)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        yield from stream_output
-        err = stream_output.error()
-        if err is not None:
-            raise err
+        return _unwrap_stream(lambda: self.call_server_stream(req, extra_headers, timeout_seconds))
 
     def call_server_stream(
         self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> StreamOutput[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
         """Low-level method to call ServerStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/ServerStream"
+        url = self._url_server_stream
         return self._connect_client.call_server_streaming(
             url, req, connectrpc.conformance.v1.service_pb2.ServerStreamResponse, extra_headers, timeout_seconds
         )
@@ -93,7 +108,7 @@ class ConformanceServiceClient:
         self, reqs: Iterable[connectrpc.conformance.v1.service_pb2.ClientStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> ClientStreamingOutput[connectrpc.conformance.v1.service_pb2.ClientStreamResponse]:
         """Low-level method to call ClientStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/ClientStream"
+        url = self._url_client_stream
         return self._connect_client.call_client_streaming(
             url, reqs, connectrpc.conformance.v1.service_pb2.ClientStreamResponse, extra_headers, timeout_seconds
         )
@@ -113,25 +128,13 @@ class ConformanceServiceClient:
     def bidi_stream(
         self, reqs: Iterable[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> Iterator[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
-        return self._bidi_stream_iterator(reqs, extra_headers, timeout_seconds)
-
-    def _bidi_stream_iterator(
-        self, reqs: Iterable[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> Iterator[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
-        stream_output = self.call_bidi_stream(reqs, extra_headers, timeout_seconds)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        yield from stream_output
-        err = stream_output.error()
-        if err is not None:
-            raise err
+        return _unwrap_stream(lambda: self.call_bidi_stream(reqs, extra_headers, timeout_seconds))
 
     def call_bidi_stream(
         self, reqs: Iterable[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> StreamOutput[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
         """Low-level method to call BidiStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/BidiStream"
+        url = self._url_bidi_stream
         return self._connect_client.call_bidirectional_streaming(
             url, reqs, connectrpc.conformance.v1.service_pb2.BidiStreamResponse, extra_headers, timeout_seconds
         )
@@ -140,44 +143,32 @@ class ConformanceServiceClient:
         self, req: connectrpc.conformance.v1.service_pb2.UnimplementedRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.UnimplementedResponse]:
         """Low-level method to call Unimplemented, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/Unimplemented"
+        url = self._url_unimplemented
         return self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.UnimplementedResponse,extra_headers, timeout_seconds)
 
 
     def unimplemented(
         self, req: connectrpc.conformance.v1.service_pb2.UnimplementedRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.UnimplementedResponse:
-        response = self.call_unimplemented(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(self.call_unimplemented(req, extra_headers, timeout_seconds))
 
     def call_idempotent_unary(
         self, req: connectrpc.conformance.v1.service_pb2.IdempotentUnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse]:
         """Low-level method to call IdempotentUnary, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/IdempotentUnary"
+        url = self._url_idempotent_unary
         return self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse,extra_headers, timeout_seconds)
 
 
     def idempotent_unary(
         self, req: connectrpc.conformance.v1.service_pb2.IdempotentUnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse:
-        response = self.call_idempotent_unary(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(self.call_idempotent_unary(req, extra_headers, timeout_seconds))
 
 
 class AsyncConformanceServiceClient:
+    __slots__ = ("base_url", "_connect_client", "_url_unary", "_url_server_stream", "_url_client_stream", "_url_bidi_stream", "_url_unimplemented", "_url_idempotent_unary")
+
     def __init__(
         self,
         base_url: str,
@@ -186,39 +177,29 @@ class AsyncConformanceServiceClient:
     ):
         self.base_url = base_url
         self._connect_client = AsyncConnectClient(http_client, protocol)
+        self._url_unary = base_url + "/connectrpc.conformance.v1.ConformanceService/Unary"
+        self._url_server_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/ServerStream"
+        self._url_client_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/ClientStream"
+        self._url_bidi_stream = base_url + "/connectrpc.conformance.v1.ConformanceService/BidiStream"
+        self._url_unimplemented = base_url + "/connectrpc.conformance.v1.ConformanceService/Unimplemented"
+        self._url_idempotent_unary = base_url + "/connectrpc.conformance.v1.ConformanceService/IdempotentUnary"
 
     async def call_unary(
         self, req: connectrpc.conformance.v1.service_pb2.UnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.UnaryResponse]:
         """Low-level method to call Unary, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/Unary"
+        url = self._url_unary
         return await self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.UnaryResponse,extra_headers, timeout_seconds)
 
     async def unary(
         self, req: connectrpc.conformance.v1.service_pb2.UnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.UnaryResponse:
-        response = await self.call_unary(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(await self.call_unary(req, extra_headers, timeout_seconds))
 
-    def server_stream(
+    async def server_stream(
         self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncIterator[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
-        return self._server_stream_iterator(req, extra_headers, timeout_seconds)
-
-    async def _server_stream_iterator(
-        self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> AsyncIterator[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
-        stream_output = await self.call_server_stream(req, extra_headers)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        async with stream_output as stream:
+        async with await self.call_server_stream(req, extra_headers, timeout_seconds) as stream:
             async for response in stream:
                 yield response
             err = stream.error()
@@ -229,7 +210,7 @@ class AsyncConformanceServiceClient:
         self, req: connectrpc.conformance.v1.service_pb2.ServerStreamRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncStreamOutput[connectrpc.conformance.v1.service_pb2.ServerStreamResponse]:
         """Low-level method to call ServerStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/ServerStream"
+        url = self._url_server_stream
         return await self._connect_client.call_server_streaming(
             url, req, connectrpc.conformance.v1.service_pb2.ServerStreamResponse, extra_headers, timeout_seconds
         )
@@ -238,7 +219,7 @@ class AsyncConformanceServiceClient:
         self, reqs: StreamInput[connectrpc.conformance.v1.service_pb2.ClientStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> ClientStreamingOutput[connectrpc.conformance.v1.service_pb2.ClientStreamResponse]:
         """Low-level method to call ClientStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/ClientStream"
+        url = self._url_client_stream
         return await self._connect_client.call_client_streaming(
             url, reqs, connectrpc.conformance.v1.service_pb2.ClientStreamResponse, extra_headers, timeout_seconds
         )
@@ -255,19 +236,10 @@ class AsyncConformanceServiceClient:
             raise RuntimeError('ClientStreamOutput has empty error and message')
         return msg
 
-    def bidi_stream(
-        self, reqs: StreamInput[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
-    ) -> AsyncIterator[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
-        return self._bidi_stream_iterator(reqs, extra_headers, timeout_seconds)
-
-    async def _bidi_stream_iterator(
+    async def bidi_stream(
         self, reqs: StreamInput[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncIterator[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
-        stream_output = await self.call_bidi_stream(reqs, extra_headers, timeout_seconds)
-        err = stream_output.error()
-        if err is not None:
-            raise err
-        async with stream_output as stream:
+        async with await self.call_bidi_stream(reqs, extra_headers, timeout_seconds) as stream:
             async for response in stream:
                 yield response
             err = stream.error()
@@ -278,7 +250,7 @@ class AsyncConformanceServiceClient:
         self, reqs: StreamInput[connectrpc.conformance.v1.service_pb2.BidiStreamRequest], extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> AsyncStreamOutput[connectrpc.conformance.v1.service_pb2.BidiStreamResponse]:
         """Low-level method to call BidiStream, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/BidiStream"
+        url = self._url_bidi_stream
         return await self._connect_client.call_bidirectional_streaming(
             url, reqs, connectrpc.conformance.v1.service_pb2.BidiStreamResponse, extra_headers, timeout_seconds
         )
@@ -287,39 +259,25 @@ class AsyncConformanceServiceClient:
         self, req: connectrpc.conformance.v1.service_pb2.UnimplementedRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.UnimplementedResponse]:
         """Low-level method to call Unimplemented, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/Unimplemented"
+        url = self._url_unimplemented
         return await self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.UnimplementedResponse,extra_headers, timeout_seconds)
 
     async def unimplemented(
         self, req: connectrpc.conformance.v1.service_pb2.UnimplementedRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.UnimplementedResponse:
-        response = await self.call_unimplemented(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(await self.call_unimplemented(req, extra_headers, timeout_seconds))
 
     async def call_idempotent_unary(
         self, req: connectrpc.conformance.v1.service_pb2.IdempotentUnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> UnaryOutput[connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse]:
         """Low-level method to call IdempotentUnary, granting access to errors and metadata"""
-        url = self.base_url + "/connectrpc.conformance.v1.ConformanceService/IdempotentUnary"
+        url = self._url_idempotent_unary
         return await self._connect_client.call_unary(url, req, connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse,extra_headers, timeout_seconds)
 
     async def idempotent_unary(
         self, req: connectrpc.conformance.v1.service_pb2.IdempotentUnaryRequest,extra_headers: HeaderInput | None=None, timeout_seconds: float | None=None
     ) -> connectrpc.conformance.v1.service_pb2.IdempotentUnaryResponse:
-        response = await self.call_idempotent_unary(req, extra_headers, timeout_seconds)
-        err = response.error()
-        if err is not None:
-            raise err
-        msg = response.message()
-        if msg is None:
-            raise ConnectProtocolError('missing response message')
-        return msg
+        return _unwrap_unary(await self.call_idempotent_unary(req, extra_headers, timeout_seconds))
 
 
 @typing.runtime_checkable
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import struct
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.message import Message
+
+from connectrpc.client_connect import _MAX_ERROR_BODY
+from connectrpc.client_connect import AsyncConnectProtocolClient
+from connectrpc.client_connect import ConnectAsyncStreamOutput
+from connectrpc.client_connect import ConnectProtocolClient
+from connectrpc.client_connect import ConnectStreamOutput
+from connectrpc.connect_serialization import CONNECT_PROTOBUF_SERIALIZATION
+from connectrpc.errors import ConnectError
+from connectrpc.errors import ConnectErrorCode
+
+# A Connect stream envelope: a flags byte and a big-endian message length.
+ENVELOPE = struct.Struct(">BI")
+FLAG_END_STREAM = 0x02
+
+DURATIONS = [Duration(seconds=1, nanos=5), Duration(seconds=2), Duration(seconds=3, nanos=7)]
+
+
+def frame(flags: int, data: bytes) -> bytes:
+    return ENVELOPE.pack(flags, len(data)) + data
+
+
+def stream_body(msgs: list[Duration], end_stream: bytes = b"{}") -> bytes:
+    body = b"".join(frame(0, m.SerializeToString()) for m in msgs)
+    return body + frame(FLAG_END_STREAM, end_stream)
+
+
+class FakeSyncResponse:
+    """Stands in for a urllib3 response, returning the body in chunks
+    of at most chunk_size bytes.
+    """
+
+    def __init__(self, body: bytes, chunk_size: int = 8192):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.headers: dict[str, str] = {}
+        self.status = 200
+        self.released = False
+
+    def read(self, n: int = -1) -> bytes:
+        if n < 0 or n > self.chunk_size:
+            n = self.chunk_size
+        chunk, self.body = self.body[:n], self.body[n:]
+        return chunk
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+def sync_stream(body: bytes, reuse_message: bool = False) -> ConnectStreamOutput[Duration]:
+    return ConnectStreamOutput(
+        FakeSyncResponse(body),  # type: ignore[arg-type]
+        Duration,
+        CONNECT_PROTOBUF_SERIALIZATION,
+        reuse_message,
+    )
+
+
+def test_stream_reuse_message_contents_per_iteration() -> None:
+    stream = sync_stream(stream_body(DURATIONS), reuse_message=True)
+    seen = [m.SerializeToString() for m in stream]
+
+    assert seen == [d.SerializeToString() for d in DURATIONS]
+    assert stream.error() is None
+
+
+def test_stream_reuse_message_aliases_collected_messages() -> None:
+    stream = sync_stream(stream_body(DURATIONS), reuse_message=True)
+    msgs = list(stream)
+
+    assert all(m is msgs[0] for m in msgs)
+    assert msgs == [DURATIONS[-1]] * len(DURATIONS)
+
+
+def test_stream_without_reuse_message_keeps_each_message() -> None:
+    msgs = list(sync_stream(stream_body(DURATIONS)))
+
+    assert msgs == DURATIONS
+
+
+class FakeStreamReader:
+    """Stands in for aiohttp's StreamReader, handing out the body in
+    the given chunks.
+    """
+
+    def __init__(self, chunks: Sequence[bytes]):
+        self.chunks = [c for c in chunks if c]
+        self.drained = False
+
+    async def readany(self) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+    async def read(self, n: int = -1) -> bytes:
+        assert n == -1
+        rest = b"".join(self.chunks)
+        self.chunks.clear()
+        self.drained = True
+        return rest
+
+
+class FakeAsyncResponse:
+    def __init__(self, chunks: Sequence[bytes]):
+        self.content = FakeStreamReader(chunks)
+        self.headers: dict[str, str] = {}
+        self.released = False
+
+    async def release(self) -> None:
+        self.released = True
+
+
+def async_stream(
+    chunks: Sequence[bytes],
+) -> tuple[ConnectAsyncStreamOutput[Duration], FakeAsyncResponse]:
+    resp = FakeAsyncResponse(chunks)
+    stream = ConnectAsyncStreamOutput(
+        resp,  # type: ignore[arg-type]
+        Duration,
+        CONNECT_PROTOBUF_SERIALIZATION,
+    )
+    return stream, resp
+
+
+async def collect(stream: ConnectAsyncStreamOutput[Duration]) -> list[Duration]:
+    return [m async for m in stream]
+
+
+def split_at(body: bytes, *offsets: int) -> list[bytes]:
+    bounds = [0, *offsets, len(body)]
+    return [body[a:b] for a, b in itertools.pairwise(bounds)]
+
+
+END_STREAM = b'{"metadata": {"trailer-key": ["trailer-value"]}}'
+BODY = stream_body(DURATIONS, END_STREAM)
+# Offsets in BODY at which each message frame ends.
+FRAME_ENDS = list(itertools.accumulate(ENVELOPE.size + d.ByteSize() for d in DURATIONS))
+
+
+async def test_async_stream_several_frames_in_one_chunk() -> None:
+    stream, resp = async_stream([BODY])
+
+    assert await collect(stream) == DURATIONS
+    assert stream.done()
+    assert stream.error() is None
+    assert stream.response_trailers()["trailer-key"] == "trailer-value"
+    assert resp.released
+
+
+@pytest.mark.parametrize("offset", range(1, len(BODY)))
+async def test_async_stream_split_at_every_offset(offset: int) -> None:
+    stream, resp = async_stream(split_at(BODY, offset))
+
+    assert await collect(stream) == DURATIONS
+    assert stream.response_trailers()["trailer-key"] == "trailer-value"
+    assert resp.released
+
+
+async def test_async_stream_one_byte_chunks() -> None:
+    stream, _ = async_stream([BODY[i : i + 1] for i in range(len(BODY))])
+
+    assert await collect(stream) == DURATIONS
+    assert stream.response_trailers()["trailer-key"] == "trailer-value"
+
+
+@pytest.mark.parametrize("split", [False, True])
+async def test_async_stream_end_stream_with_trailing_bytes(split: bool) -> None:
+    trailing = frame(0, Duration(seconds=9).SerializeToString()) + b"junk"
+    chunks = [BODY, trailing] if split else [BODY + trailing]
+    stream, resp = async_stream(chunks)
+
+    # Nothing after the end-stream frame is parsed, but it is drained so
+    # the connection can be reused.
+    assert await collect(stream) == DURATIONS
+    assert stream.response_trailers()["trailer-key"] == "trailer-value"
+    assert resp.content.drained
+    assert not resp.content.chunks
+    assert resp.released
+
+
+async def test_async_stream_end_stream_error() -> None:
+    body = stream_body(DURATIONS[:1], b'{"error": {"code": "unavailable", "message": "gone"}}')
+    stream, _ = async_stream(split_at(body, 3, 12))
+
+    assert await collect(stream) == DURATIONS[:1]
+    err = stream.error()
+    assert err is not None
+    assert err.message == "gone"
+
+
+@pytest.mark.parametrize("length", range(FRAME_ENDS[-1]))
+async def test_async_stream_truncated(length: int) -> None:
+    # Cut the body anywhere before the end-stream frame: mid-header,
+    # mid-body, or between frames.
+    truncated = BODY[:length]
+    stream, _ = async_stream(split_at(truncated, length // 2))
+    complete = sum(1 for end in FRAME_ENDS if end <= length)
+
+    for d in DURATIONS[:complete]:
+        assert await stream.__anext__() == d
+    with pytest.raises(asyncio.IncompleteReadError) as exc_info:
+        await stream.__anext__()
+    assert exc_info.value.partial == truncated[FRAME_ENDS[complete - 1] if complete else 0 :]
+
+
+@pytest.mark.parametrize("cut", range(1, len(BODY) - FRAME_ENDS[-1] + 1))
+async def test_async_stream_truncated_end_stream(cut: int) -> None:
+    stream, _ = async_stream([BODY[:-cut]])
+
+    assert [await stream.__anext__() for _ in DURATIONS] == DURATIONS
+    with pytest.raises(asyncio.IncompleteReadError):
+        await stream.__anext__()
+
+
+# Request streams of every shape the clients accept. Lists and tuples are
+# framed into one body up front; iterators are framed as they're sent.
+# Either way the bytes on the wire must be the same.
+REQUEST_SHAPES = ["list", "tuple", "generator", "iterator"]
+
+
+def request_stream(shape: str, msgs: list[Duration]) -> Iterable[Duration]:
+    if shape == "list":
+        return list(msgs)
+    if shape == "tuple":
+        return tuple(msgs)
+    if shape == "generator":
+        return (m for m in msgs)
+    return iter(msgs)
+
+
+def expected_request_body(msgs: list[Duration]) -> bytes:
+    return b"".join(frame(0, m.SerializeToString()) for m in msgs)
+
+
+class RecordingPoolManager:
+    def __init__(self) -> None:
+        self.bodies: list[bytes] = []
+
+    def request(self, method: str, url: str, body: Any = None, **kwargs: Any) -> FakeSyncResponse:
+        if not isinstance(body, bytes):
+            body = b"".join(body)
+        self.bodies.append(body)
+        resp = FakeSyncResponse(frame(FLAG_END_STREAM, b"{}"))
+        resp.headers["Content-Type"] = "application/connect+proto"
+        return resp
+
+
+@pytest.mark.parametrize("shape", REQUEST_SHAPES)
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_sync_request_stream_bodies_match(shape: str, count: int) -> None:
+    pool = RecordingPoolManager()
+    client = ConnectProtocolClient(pool)  # type: ignore[arg-type]
+    msgs = DURATIONS[:count]
+
+    with client.call_streaming("http://localhost/x", request_stream(shape, msgs), Duration) as out:
+        assert list(out) == []
+
+    assert pool.bodies == [expected_request_body(msgs)]
+
+
+async def as_async_iterator(msgs: Iterable[Message]) -> AsyncIterator[Message]:
+    for m in msgs:
+        yield m
+
+
+@pytest.mark.parametrize("shape", [*REQUEST_SHAPES, "async"])
+@pytest.mark.parametrize("count", [0, 1, 3])
+async def test_async_request_stream_bodies_match(shape: str, count: int) -> None:
+    bodies: list[bytes] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        bodies.append(await request.read())
+        return web.Response(
+            body=frame(FLAG_END_STREAM, b"{}"),
+            headers={"Content-Type": "application/connect+proto"},
+        )
+
+    app = web.Application()
+    app.router.add_post("/x", handler)
+    msgs = DURATIONS[:count]
+    reqs: Any = request_stream(shape, msgs)
+    if shape in ("generator", "iterator", "async"):
+        reqs = as_async_iterator(request_stream(shape, msgs))
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = AsyncConnectProtocolClient(session)
+        async with await client.call_streaming(str(server.make_url("/x")), reqs, Duration) as out:
+            assert [m async for m in out] == []
+
+    assert bodies == [expected_request_body(msgs)]
+
+
+ERROR_JSON = b'{"code": "unavailable", "message": "gone"}'
+
+
+async def call_unary_with_error_body(
+    body: bytes, requests: int = 1, finish: bool = True
+) -> list[ConnectError]:
+    # Unless finish is set, the handler sends the body but doesn't end the
+    # response until the client has made all its requests.
+    done = asyncio.Event()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse(status=503, headers={"Content-Type": "application/json"})
+        await resp.prepare(request)
+        await resp.write(body)
+        if not finish:
+            await done.wait()
+        await resp.write_eof()
+        return resp
+
+    app = web.Application()
+    app.router.add_post("/x", handler)
+    errors: list[ConnectError] = []
+    connector = aiohttp.TCPConnector(limit=1)
+    async with TestServer(app) as server, aiohttp.ClientSession(connector=connector) as session:
+        client = AsyncConnectProtocolClient(session)
+        try:
+            for _ in range(requests):
+                call = client.call_unary(str(server.make_url("/x")), Duration(), Duration)
+                out = await asyncio.wait_for(call, 5)
+                err = out.error()
+                assert err is not None
+                errors.append(err)
+        finally:
+            done.set()
+    return errors
+
+
+async def test_async_error_body_is_parsed() -> None:
+    [err] = await call_unary_with_error_body(ERROR_JSON)
+
+    assert err.code == ConnectErrorCode.UNAVAILABLE
+    assert err.message == "gone"
+
+
+async def test_async_error_body_at_limit_is_parsed() -> None:
+    body = ERROR_JSON.ljust(_MAX_ERROR_BODY)
+    [err] = await call_unary_with_error_body(body)
+
+    assert err.message == "gone"
+
+
+async def test_async_error_body_too_large() -> None:
+    body = ERROR_JSON.ljust(_MAX_ERROR_BODY + 1)
+    # The server never finishes these responses. The client must stop
+    # reading at the limit and close the connection, so the single pooled
+    # connection is free for the following requests.
+    errors = await call_unary_with_error_body(body, requests=3, finish=False)
+
+    assert len(errors) == 3
+    for err in errors:
+        assert err.code == ConnectErrorCode.UNAVAILABLE
+        assert err.http_status == 503
+        assert "error response body is larger than" in err.message
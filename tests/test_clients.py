@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import aiohttp
+import urllib3
+from google.protobuf.duration_pb2 import Duration
+
+from connectrpc.client_async import AsyncConnectClient
+from connectrpc.client_sync import ConnectClient
+
+
+def test_sync_client_subclass_override_is_used() -> None:
+    class Recording(ConnectClient):
+        def call_unary(self, *args: Any, **kwargs: Any) -> Any:
+            return "overridden"
+
+    client = Recording(urllib3.PoolManager())
+    assert client.call_unary("http://localhost/x", Duration(), Duration) == "overridden"
+
+
+def test_sync_client_patch_object_is_used() -> None:
+    client = ConnectClient(urllib3.PoolManager())
+    patched: Any = mock.sentinel.patched
+    with mock.patch.object(ConnectClient, "call_server_streaming", return_value=patched):
+        assert client.call_server_streaming("http://localhost/x", Duration(), Duration) is patched
+
+
+def test_sync_client_delegates_to_protocol_client() -> None:
+    client = ConnectClient(urllib3.PoolManager())
+    with mock.patch.object(client, "_client") as protocol_client:
+        client.call_bidirectional_streaming("http://localhost/x", [Duration()], Duration)
+    protocol_client.call_streaming.assert_called_once()
+
+
+async def test_async_client_patch_object_is_used() -> None:
+    async with aiohttp.ClientSession() as session:
+        client = AsyncConnectClient(session)
+        patched: Any = mock.sentinel.patched
+        with mock.patch.object(AsyncConnectClient, "call_unary", return_value=patched):
+            assert await client.call_unary("http://localhost/x", Duration(), Duration) is patched
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import zlib
+
+import pytest
+
+from connectrpc.connect_compression import GzipCodec
+
+PAYLOAD = b"".join(b"message %d, " % i for i in range(2000))
+
+
+def gzip_compress(data: bytes) -> bytes:
+    compressor = GzipCodec.compressor()
+    return compressor.compress(data) + compressor.flush()
+
+
+def test_gzip_compresses_like_zlib() -> None:
+    # The compressor always uses the standard library, at its default
+    # level, whether or not isal is installed.
+    expected = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    assert gzip_compress(PAYLOAD) == expected.compress(PAYLOAD) + expected.flush()
+
+
+def test_gzip_round_trip() -> None:
+    data = gzip_compress(PAYLOAD)
+
+    assert GzipCodec.decompress(data) == PAYLOAD
+    assert GzipCodec.decompressor().decompress(data) == PAYLOAD
+
+
+def test_gzip_corrupt_data_raises_zlib_error() -> None:
+    data = b"\x1f\x8b not really gzip"
+
+    with pytest.raises(zlib.error):
+        GzipCodec.decompress(data)
+    with pytest.raises(zlib.error):
+        GzipCodec.decompressor().decompress(data)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from google.protobuf import json_format
+from google.protobuf.any_pb2 import Any
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.empty_pb2 import Empty
+from google.protobuf.field_mask_pb2 import FieldMask
+from google.protobuf.message import Message
+from google.protobuf.struct_pb2 import ListValue
+from google.protobuf.struct_pb2 import Struct
+from google.protobuf.struct_pb2 import Value
+from google.protobuf.timestamp_pb2 import Timestamp
+from google.protobuf.wrappers_pb2 import BytesValue
+from google.protobuf.wrappers_pb2 import DoubleValue
+from google.protobuf.wrappers_pb2 import Int64Value
+from google.protobuf.wrappers_pb2 import UInt64Value
+
+from connectrpc import connect_serialization
+from connectrpc.connect_serialization import CONNECT_JSON_SERIALIZATION
+from connectrpc.connect_serialization import CONNECT_PROTOBUF_SERIALIZATION
+from connectrpc.connect_serialization import ConnectSerialization
+
+SERIALIZATIONS = [
+    pytest.param(CONNECT_PROTOBUF_SERIALIZATION, id="protobuf"),
+    pytest.param(CONNECT_JSON_SERIALIZATION, id="json"),
+]
+
+# The second message leaves nanos unset, so a reused message which isn't
+# cleared between frames would still carry the first one's nanos.
+DURATIONS = [Duration(seconds=1, nanos=5), Duration(seconds=2), Duration(seconds=3, nanos=7)]
+
+
+@pytest.mark.parametrize("ser", SERIALIZATIONS)
+def test_parser_returns_new_messages(ser: ConnectSerialization) -> None:
+    parse = ser.parser(Duration)
+    msgs = [parse(ser.serialize(d)) for d in DURATIONS]
+
+    assert msgs == DURATIONS
+    assert len({id(m) for m in msgs}) == len(msgs)
+
+
+@pytest.mark.parametrize("ser", SERIALIZATIONS)
+def test_reusing_parser_contents_per_call(ser: ConnectSerialization) -> None:
+    parse = ser.parser(Duration, reuse_message=True)
+    for d in DURATIONS:
+        assert parse(ser.serialize(d)) == d
+
+
+@pytest.mark.parametrize("ser", SERIALIZATIONS)
+def test_reusing_parser_aliases_messages(ser: ConnectSerialization) -> None:
+    parse = ser.parser(Duration, reuse_message=True)
+    msgs = [parse(ser.serialize(d)) for d in DURATIONS]
+
+    # Every call returns the same instance, so collecting them leaves N
+    # references to the last message.
+    assert all(m is msgs[0] for m in msgs)
+    assert msgs == [DURATIONS[-1]] * len(DURATIONS)
+
+
+def test_reusing_parser_json_matches_protobuf() -> None:
+    parse_json = CONNECT_JSON_SERIALIZATION.parser(Duration, reuse_message=True)
+    parse_proto = CONNECT_PROTOBUF_SERIALIZATION.parser(Duration, reuse_message=True)
+    for d in DURATIONS:
+        from_json = parse_json(CONNECT_JSON_SERIALIZATION.serialize(d))
+        from_proto = parse_proto(CONNECT_PROTOBUF_SERIALIZATION.serialize(d))
+        assert from_json == from_proto
+        assert from_json.SerializeToString() == from_proto.SerializeToString()
+
+
+def _any(msg: Message) -> Any:
+    a = Any()
+    a.Pack(msg)
+    return a
+
+
+def _struct() -> Struct:
+    s = Struct()
+    s.update({"n": 1.5, "s": "x", "b": True, "z": None, "l": [1, "two"], "o": {"k": "v"}})
+    return s
+
+
+# Messages whose JSON encodings exercise the well-known types and 64-bit
+# integers, which JSON carries as strings.
+JSON_PARITY_MESSAGES = [
+    Empty(),
+    Int64Value(value=2**63 - 1),
+    Int64Value(value=-(2**63)),
+    UInt64Value(value=2**64 - 1),
+    DoubleValue(value=1e300),
+    BytesValue(value=b"\x00\xff binary"),
+    Timestamp(seconds=1700000000, nanos=123000000),
+    Duration(seconds=-5, nanos=-500000000),
+    FieldMask(paths=["a.b", "c"]),
+    _struct(),
+    Value(list_value=ListValue(values=[Value(string_value="x"), Value(number_value=2)])),
+    _any(Duration(seconds=3)),
+]
+
+
+@pytest.mark.parametrize("msg", JSON_PARITY_MESSAGES, ids=lambda m: type(m).__name__)
+def test_json_serialize_matches_json_format(msg: Message) -> None:
+    data = CONNECT_JSON_SERIALIZATION.serialize(msg)
+    assert json.loads(data) == json.loads(json_format.MessageToJson(msg))
+
+
+@pytest.mark.parametrize("msg", JSON_PARITY_MESSAGES, ids=lambda m: type(m).__name__)
+def test_json_deserialize_matches_json_format(msg: Message) -> None:
+    data = json_format.MessageToJson(msg).encode()
+    expected = json_format.Parse(data, type(msg)())
+    assert CONNECT_JSON_SERIALIZATION.deserialize(data, type(msg)) == expected
+    assert CONNECT_JSON_SERIALIZATION.parser(type(msg), reuse_message=True)(data) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "typ"),
+    [
+        (b"{bad", Duration),
+        (b"", Empty),
+        (b'"1s"', Int64Value),
+        (b'{"value": {}}', Int64Value),
+        (b'"not a timestamp"', Timestamp),
+        (b"[1]", Struct),
+        (b'{"unknownField": 1}', Timestamp),
+    ],
+)
+def test_json_errors_match_json_format(data: bytes, typ: type[Message]) -> None:
+    with pytest.raises(json_format.ParseError):
+        json_format.Parse(data, typ())
+    with pytest.raises(json_format.ParseError):
+        CONNECT_JSON_SERIALIZATION.deserialize(data, typ)
+
+
+def test_json_duplicate_keys() -> None:
+    # A documented difference between the backends: json_format rejects
+    # duplicate keys, orjson keeps the last one.
+    data = b'{"a": 1, "a": 2}'
+    with pytest.raises(json_format.ParseError):
+        json_format.Parse(data, Struct())
+    if hasattr(connect_serialization, "orjson"):
+        assert CONNECT_JSON_SERIALIZATION.deserialize(data, Struct) == json_format.ParseDict(
+            {"a": 2}, Struct()
+        )
+    else:
+        with pytest.raises(json_format.ParseError):
+            CONNECT_JSON_SERIALIZATION.deserialize(data, Struct)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from google.protobuf.duration_pb2 import Duration
+
+from connectrpc.errors import ConnectError
+from connectrpc.errors import ConnectErrorCode
+
+
+def test_to_json_round_trips() -> None:
+    err = ConnectError(ConnectErrorCode.NOT_FOUND, 'no "such" thing é')
+
+    assert json.loads(err.to_json()) == {
+        "code": "not_found",
+        "message": 'no "such" thing é',
+        "details": [],
+    }
+
+
+def test_to_json_lone_surrogate() -> None:
+    # Messages built from str(exc) can carry surrogate-escaped bytes, for
+    # example from file paths, which aren't valid UTF-8.
+    err = ConnectError(ConnectErrorCode.INTERNAL, "bad \udc80 byte")
+
+    assert json.loads(err.to_json())["message"] == "bad \udc80 byte"
+
+    err.add_detail(Duration(seconds=1))
+    assert json.loads(err.to_json()) == json.loads(json.dumps(err.to_dict()))
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from connectrpc.errors import ConnectError
+from connectrpc.errors import ConnectErrorCode
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+@pytest.fixture
+def eliza(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    # The generated example imports eliza_pb2 as a top-level module.
+    monkeypatch.syspath_prepend(str(EXAMPLES_DIR))
+    return importlib.import_module("eliza_pb2_connect")
+
+
+class FakeStreamOutput:
+    def __init__(self, msgs: list[Any], error: ConnectError | None = None):
+        self.msgs = msgs
+        self._error: ConnectError | None = None
+        self.end_error = error
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self.msgs
+        self._error = self.end_error
+
+    def error(self) -> ConnectError | None:
+        return self._error
+
+
+class FakeConnectClient:
+    def __init__(self, output: FakeStreamOutput):
+        self.output = output
+        self.calls = 0
+
+    def call_server_streaming(self, *args: Any, **kwargs: Any) -> FakeStreamOutput:
+        self.calls += 1
+        return self.output
+
+
+def test_streaming_method_is_not_a_generator(eliza: ModuleType) -> None:
+    # Each message should pass through a single generator frame, the
+    # shared _unwrap_stream helper, rather than one per wrapper.
+    assert not inspect.isgeneratorfunction(eliza.ElizaServiceClient.introduce)
+    assert not inspect.isgeneratorfunction(eliza.ElizaServiceClient.converse)
+
+
+def test_streaming_method_calls_lazily(eliza: ModuleType) -> None:
+    msgs = [eliza.eliza_pb2.IntroduceResponse(sentence=s) for s in ("a", "b")]
+    fake = FakeConnectClient(FakeStreamOutput(msgs))
+    client = eliza.ElizaServiceClient("http://localhost")
+    client._connect_client = fake
+
+    it = client.introduce(eliza.eliza_pb2.IntroduceRequest(name="x"))
+    assert fake.calls == 0
+    assert list(it) == msgs
+    assert fake.calls == 1
+
+
+def test_streaming_method_raises_end_of_stream_error(eliza: ModuleType) -> None:
+    msg = eliza.eliza_pb2.IntroduceResponse(sentence="a")
+    err = ConnectError(ConnectErrorCode.UNAVAILABLE, "gone")
+    client = eliza.ElizaServiceClient("http://localhost")
+    client._connect_client = FakeConnectClient(FakeStreamOutput([msg], err))
+
+    it = client.introduce(eliza.eliza_pb2.IntroduceRequest(name="x"))
+    assert next(it) == msg
+    with pytest.raises(ConnectError) as exc_info:
+        next(it)
+    assert exc_info.value is err
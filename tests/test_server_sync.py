@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import io
+from typing import Any
+
+from google.protobuf.duration_pb2 import Duration
+
+from connectrpc.server import ClientRequest
+from connectrpc.server import ServerResponse
+from connectrpc.server_sync import ConnectWSGI
+
+
+def call_unary(app: ConnectWSGI, path: str, msg: Duration, **http_headers: str) -> str:
+    body = msg.SerializeToString()
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": path,
+        "CONTENT_TYPE": "application/proto",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        **{f"HTTP_{k}": v for k, v in http_headers.items()},
+    }
+    statuses: list[str] = []
+
+    def start_response(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> Any:
+        statuses.append(status)
+
+    b"".join(app(environ, start_response))
+    return statuses[0]
+
+
+def test_request_trailers_reach_client_request() -> None:
+    seen: list[ClientRequest[Duration]] = []
+
+    def echo(req: ClientRequest[Duration]) -> ServerResponse[Duration]:
+        seen.append(req)
+        return ServerResponse(req.msg)
+
+    app = ConnectWSGI()
+    app.register_unary_rpc("/svc/Echo", echo, Duration)
+
+    # WSGI upper-cases header names, so these arrive as TRAILER-FOO etc.
+    status = call_unary(app, "/svc/Echo", Duration(seconds=1), TRAILER_FOO="bar", X_OTHER="baz")
+
+    assert status.startswith("200")
+    [req] = seen
+    assert req.msg == Duration(seconds=1)
+    assert dict(req.trailers) == {"TRAILER-FOO": "bar"}
+    assert req.trailers["trailer-foo"] == "bar"
+    assert req.headers["x-other"] == "baz"